@@ -162,7 +162,7 @@ async def get_merge_candidates(item_id: str):
 async def merge_items(source_id: str, target_id: str):
     """Merge source item into target item"""
     try:
-        result_id = graph_service.merge_items(source_id, target_id)
+        result_id, _ = graph_service.merge_items(source_id, target_id)
         return {
             "success": True,
             "target_item_id": result_id,
@@ -6,14 +6,20 @@ class Neo4jConnection:
     def __init__(self):
         self.driver = None
 
-    def connect(self):
+    def connect(self, **driver_config):
+        # Reuse the existing driver (and its connection pool) if already connected
+        if self.driver is not None:
+            return
         self.driver = GraphDatabase.driver(
-            settings.NEO4J_URI, auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+            settings.NEO4J_URI,
+            auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+            **driver_config,
         )
 
     def close(self):
         if self.driver:
             self.driver.close()
+            self.driver = None
 
     def test_connection(self):
         with self.driver.session() as session:
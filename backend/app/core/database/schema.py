@@ -31,6 +31,39 @@ def create_indexes(session: Session):
         session.run(index)
 
 
+def create_text_indexes(session: Session):
+    """Create text indexes used for CONTAINS lookups"""
+    # Name searches match on the lowercased name_lc; nothing queries the text
+    # index on the raw name any more
+    session.run("DROP INDEX item_name_text IF EXISTS")
+
+    text_indexes = [
+        "CREATE TEXT INDEX item_name_lc_text IF NOT EXISTS FOR (i:Item) ON (i.name_lc)",
+    ]
+
+    for index in text_indexes:
+        session.run(index)
+
+
+def backfill_item_name_lc(session: Session):
+    """Set the lowercased name on items created before name_lc existed"""
+    session.run("""
+        MATCH (i:Item)
+        WHERE i.name_lc IS NULL AND i.name IS NOT NULL
+        SET i.name_lc = toLower(i.name)
+        """)
+
+
+def prepare_name_search(session: Session):
+    """Make sure every Item can be found by the name_lc-based searches.
+
+    Idempotent: the index creation is IF NOT EXISTS and the backfill only
+    touches items still missing name_lc, so it is safe to run on every start.
+    """
+    create_text_indexes(session)
+    backfill_item_name_lc(session)
+
+
 def setup_database():
     """Initialize database schema"""
     from app.core.database.neo4j import neo4j_db
@@ -39,6 +72,7 @@ def setup_database():
     with neo4j_db.driver.session() as session:
         create_constraints(session)
         create_indexes(session)
+        prepare_name_search(session)
     print("Database schema created successfully")
 
 
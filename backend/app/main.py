@@ -1,12 +1,32 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes import items, ai, influences, canvas, enhancement
+from app.core.database.neo4j import neo4j_db
+from app.core.database.schema import prepare_name_search
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Item searches filter on name_lc, so items written before it existed
+    # must be backfilled or they silently drop out of search results
+    try:
+        with neo4j_db.driver.session() as session:
+            prepare_name_search(session)
+    except Exception as e:
+        logger.warning(f"Could not prepare item name search: {e}")
+    yield
 
 
 app = FastAPI(
     title="Influence Graph API",
     description="API for exploring influence relationships",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware - more permissive for development
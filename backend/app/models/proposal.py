@@ -1,3 +1,4 @@
+from functools import cached_property
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
@@ -80,6 +81,11 @@ class ProposalResponse(BaseModel):
     error_message: Optional[str] = Field(None)
     all_clusters: Optional[List[str]] = None
 
+    @cached_property
+    def all_influences(self) -> List[InfluenceProposal]:
+        """Every proposal, macro first, then micro and nano (built on first access)"""
+        return self.macro_influences + self.micro_influences + self.nano_influences
+
 
 class MoreProposalsRequest(BaseModel):
     """Request for more proposals in specific category/scope"""
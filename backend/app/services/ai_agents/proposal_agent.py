@@ -17,6 +17,11 @@ from app.services.ai_agents.prompts import (
 class ProposalAgent(BaseAgent):
     def __init__(self):
         super().__init__(temperature=0.4)  # Balanced creativity and consistency
+        # Built once: the system prompt is a fixed prefix shared by every call,
+        # only the {request} human message varies
+        self.proposal_prompt = self.create_prompt(
+            PROPOSAL_GENERATION_PROMPT, "{request}"
+        )
 
     async def propose_influences(
         self,
@@ -45,10 +50,10 @@ class ProposalAgent(BaseAgent):
             "\n\nReturn only valid JSON with the exact structure specified."
         )
 
-        prompt = self.create_prompt(PROPOSAL_GENERATION_PROMPT, human_message)
-
         try:
-            response = await self.invoke(prompt, {})
+            response = await self.invoke(
+                self.proposal_prompt, {"request": human_message}
+            )
             return await self._parse_proposal_response(
                 response, item_name, item_type, creator
             )
@@ -190,9 +195,7 @@ class ProposalAgent(BaseAgent):
             data = json.loads(json_str)
 
             # Organize proposals by scope
-            macro_influences = []
-            micro_influences = []
-            nano_influences = []
+            proposals_by_scope = {"macro": [], "micro": [], "nano": []}
             all_categories = set()
             all_clusters = set()
 
@@ -206,19 +209,15 @@ class ProposalAgent(BaseAgent):
                         for cluster in proposal.clusters:
                             all_clusters.add(cluster)
 
-                    if proposal.scope == "macro":
-                        macro_influences.append(proposal)
-                    elif proposal.scope == "micro":
-                        micro_influences.append(proposal)
-                    elif proposal.scope == "nano":
-                        nano_influences.append(proposal)
+                    # Proposals with an unknown scope are dropped
+                    bucket = proposals_by_scope.get(proposal.scope)
+                    if bucket is not None:
+                        bucket.append(proposal)
 
                 except Exception as e:
                     continue
 
-            total_proposals = (
-                len(macro_influences) + len(micro_influences) + len(nano_influences)
-            )
+            total_proposals = sum(map(len, proposals_by_scope.values()))
 
             return ProposalResponse(
                 item_name=item_name,
@@ -228,9 +227,9 @@ class ProposalAgent(BaseAgent):
                     "main_item_description"
                 ),  # NEW: Add this line
                 item_year=data.get("main_item_year"),  # NEW: Add this line
-                macro_influences=macro_influences,
-                micro_influences=micro_influences,
-                nano_influences=nano_influences,
+                macro_influences=proposals_by_scope["macro"],
+                micro_influences=proposals_by_scope["micro"],
+                nano_influences=proposals_by_scope["nano"],
                 all_categories=list(all_categories),
                 all_clusters=list(all_clusters),
                 total_proposals=total_proposals,
@@ -1,6 +1,17 @@
 import uuid
+from typing import List
 from app.core.database.neo4j import neo4j_db
 
+# Words ignored when comparing item names word by word in find_similar_items
+SIMILARITY_STOP_WORDS = frozenset(
+    (
+        "the and of in on at to for with by a an as is it that this was will be have "
+        "had has do does did or but not so if then else when where why how all any "
+        "both each few more most other some such no nor only own same than too very "
+        "can may must shall should would could"
+    ).split()
+)
+
 
 class BaseGraphService:
     """
@@ -29,6 +40,24 @@ class BaseGraphService:
         else:
             return f"{clean_name}-{uuid.uuid4().hex[:8]}"
 
+    def search_tokens(self, name: str) -> List[str]:
+        """Significant lowercase words of a search name, in order with repeats.
+
+        Repeats are kept because find_similar_items counts every search word
+        toward its 60% match cutoff.
+        """
+        if not name:
+            return []
+        return [
+            word
+            for word in name.lower().split(" ")
+            if len(word) >= 3 and word not in SIMILARITY_STOP_WORDS
+        ]
+
+    def name_tokens(self, name: str) -> List[str]:
+        """Distinct significant words of a name, as stored on Item.name_tokens"""
+        return sorted(set(self.search_tokens(name)))
+
     def ensure_category_exists(self, category_name: str):
         """Create category if it doesn't exist"""
         with neo4j_db.driver.session() as session:
@@ -1,3 +1,5 @@
+from typing import Dict, List
+from app.core.database.neo4j import neo4j_db
 from app.models.structured import StructuredOutput
 from .base_service import BaseGraphService
 
@@ -35,7 +37,9 @@ class BulkService(BaseGraphService):
             )
             self._link_creator_to_item(main_item.id, creator.id, "primary_creator")
 
-        # 3. Process each influence with scope
+        # 3. Process each influence with scope; relationships are collected and
+        # written together afterwards
+        relationships = []
         for influence in structured_data.influences:
             # Create influence item
             influence_item = self._create_item(
@@ -55,25 +59,251 @@ class BulkService(BaseGraphService):
                     influence_item.id, influence_creator.id, "primary_creator"
                 )
 
-            # Create influence relationship with scope
-            self._create_influence_relationship(
-                from_item_id=influence_item.id,
-                to_item_id=main_item.id,
-                confidence=influence.confidence,
-                influence_type=influence.influence_type,
-                explanation=influence.explanation,
-                category=influence.category,
-                scope=influence.scope,  # Now includes scope
-                source=influence.source,
-                year_of_influence=influence.year,
-                clusters=influence.clusters,
+            # Influence relationship with scope
+            relationships.append(
+                {
+                    "from_item_id": influence_item.id,
+                    "to_item_id": main_item.id,
+                    "confidence": influence.confidence,
+                    "influence_type": influence.influence_type,
+                    "explanation": influence.explanation,
+                    "category": influence.category,
+                    "scope": influence.scope,  # Now includes scope
+                    "source": influence.source,
+                    "year_of_influence": influence.year,
+                    "clusters": influence.clusters,
+                }
             )
 
             # Ensure category exists
             self.ensure_category_exists(influence.category)
 
+        # 4. Create all influence relationships in one query
+        self._create_influence_relationships_batch(relationships)
+
         return main_item.id
 
+    def save_structured_influences_bulk(
+        self, structured_outputs: List[StructuredOutput]
+    ) -> List[str]:
+        """Save several structured outputs in a single write transaction.
+
+        Mirrors save_structured_influences (new items, creators matched by
+        name, category usage counts) but sends each kind of write as one
+        UNWIND query, so the whole batch costs one commit. Returns the main
+        item ids in input order.
+        """
+        items = []
+        creator_links = []
+        influences = []
+        main_item_ids = []
+
+        def add_item(name, auto_detected_type, year, description):
+            item_id = self.generate_id(name, auto_detected_type)
+            items.append(
+                {
+                    "id": item_id,
+                    "name": name,
+                    "name_tokens": self.name_tokens(name),
+                    "auto_detected_type": auto_detected_type,
+                    "year": year,
+                    "description": description,
+                }
+            )
+            return item_id
+
+        def add_creator_link(item_id, name, creator_type):
+            creator_links.append(
+                {
+                    "item_id": item_id,
+                    "id": self.generate_id(name, creator_type),
+                    "name": name,
+                    "type": creator_type,
+                }
+            )
+
+        for structured_data in structured_outputs:
+            main_item_id = add_item(
+                structured_data.main_item,
+                structured_data.main_item_type,
+                structured_data.main_item_year,
+                structured_data.main_item_description,
+            )
+            main_item_ids.append(main_item_id)
+
+            if structured_data.main_item_creator:
+                add_creator_link(
+                    main_item_id,
+                    structured_data.main_item_creator,
+                    structured_data.main_item_creator_type or "person",
+                )
+
+            for influence in structured_data.influences:
+                influence_item_id = add_item(
+                    influence.name,
+                    influence.type,
+                    influence.year,
+                    influence.explanation if influence.explanation else None,
+                )
+
+                if influence.creator_name:
+                    add_creator_link(
+                        influence_item_id,
+                        influence.creator_name,
+                        influence.creator_type or "person",
+                    )
+
+                influences.append(
+                    {
+                        "from_id": influence_item_id,
+                        "to_id": main_item_id,
+                        "confidence": influence.confidence,
+                        "influence_type": influence.influence_type,
+                        "explanation": influence.explanation,
+                        "category": influence.category,
+                        "scope": influence.scope,
+                        "source": influence.source,
+                        "year_of_influence": influence.year,
+                        "clusters": influence.clusters,
+                    }
+                )
+
+        if not items:
+            return []
+
+        try:
+            with neo4j_db.driver.session() as session:
+                session.execute_write(
+                    self._save_structured_bulk_tx, items, creator_links, influences
+                )
+        except Exception as e:
+            raise Exception(f"Failed to save structured influences: {str(e)}")
+
+        return main_item_ids
+
+    @staticmethod
+    def _save_structured_bulk_tx(tx, items, creator_links, influences):
+        """Write items, creator links, influences and categories in one transaction"""
+        tx.run(
+            """
+            UNWIND $items AS item
+            CREATE (i:Item {
+                id: item.id,
+                name: item.name,
+                name_lc: toLower(item.name),
+                name_tokens: item.name_tokens,
+                auto_detected_type: item.auto_detected_type,
+                year: item.year,
+                description: item.description,
+                confidence_score: null,
+                verification_status: "ai_generated",
+                created_at: datetime()
+            })
+            """,
+            {"items": items},
+        ).consume()
+
+        if creator_links:
+            tx.run(
+                """
+                UNWIND $links AS link
+                MERGE (c:Creator {name: link.name})
+                ON CREATE SET c.id = link.id, c.type = link.type
+                WITH c, link
+                MATCH (i:Item {id: link.item_id})
+                MERGE (i)-[:CREATED_BY {role: "primary_creator"}]->(c)
+                """,
+                {"links": creator_links},
+            ).consume()
+
+        if influences:
+            tx.run(
+                """
+                UNWIND $influences AS inf
+                MATCH (from:Item {id: inf.from_id})
+                MATCH (to:Item {id: inf.to_id})
+                MERGE (from)-[r:INFLUENCES]->(to)
+                SET r.confidence = inf.confidence,
+                    r.influence_type = inf.influence_type,
+                    r.explanation = inf.explanation,
+                    r.category = inf.category,
+                    r.scope = inf.scope,
+                    r.source = inf.source,
+                    r.year_of_influence = inf.year_of_influence,
+                    r.clusters = inf.clusters,
+                    r.created_at = datetime()
+                WITH inf
+                MERGE (cat:Category {name: inf.category})
+                ON CREATE SET cat.usage_count = 1, cat.created_at = datetime()
+                ON MATCH SET cat.usage_count = cat.usage_count + 1
+                """,
+                {"influences": influences},
+            ).consume()
+
+    def create_items_and_edge(self, items: List[Dict], edge: Dict) -> Dict[str, str]:
+        """Create several items and one influence between two of them in one tx.
+
+        ``items`` are Item property dicts (name, auto_detected_type, year,
+        description, ...). ``edge`` names its endpoints with ``from`` and ``to``
+        item names; its remaining keys become relationship properties. Returns
+        a name -> id mapping for the created items.
+        """
+        item_rows = [
+            {
+                "verification_status": "ai_generated",
+                **item,
+                "id": self.generate_id(item["name"], item.get("auto_detected_type")),
+                "name_tokens": self.name_tokens(item["name"]),
+            }
+            for item in items
+        ]
+        ids_by_name = {row["name"]: row["id"] for row in item_rows}
+
+        edge_props = {k: v for k, v in edge.items() if k not in ("from", "to")}
+        try:
+            from_id = ids_by_name[edge["from"]]
+            to_id = ids_by_name[edge["to"]]
+        except KeyError as e:
+            raise ValueError(f"Edge endpoint {e} is not one of the items")
+
+        try:
+            with neo4j_db.driver.session() as session:
+                session.execute_write(
+                    self._create_items_and_edge_tx,
+                    item_rows,
+                    from_id,
+                    to_id,
+                    edge_props,
+                )
+        except Exception as e:
+            raise Exception(f"Failed to create items and edge: {str(e)}")
+
+        return ids_by_name
+
+    @staticmethod
+    def _create_items_and_edge_tx(tx, item_rows, from_id, to_id, edge_props):
+        """Create the item nodes, then the influence between two of them"""
+        tx.run(
+            """
+            UNWIND $items AS item
+            CREATE (i:Item)
+            SET i += item,
+                i.name_lc = toLower(item.name),
+                i.created_at = datetime()
+            """,
+            {"items": item_rows},
+        ).consume()
+
+        tx.run(
+            """
+            MATCH (from:Item {id: $from_id})
+            MATCH (to:Item {id: $to_id})
+            CREATE (from)-[r:INFLUENCES]->(to)
+            SET r += $props, r.created_at = datetime()
+            """,
+            {"from_id": from_id, "to_id": to_id, "props": edge_props},
+        ).consume()
+
     def _create_item(self, **kwargs):
         """Helper method to create item"""
         if self.item_service:
@@ -100,6 +330,16 @@ class BulkService(BaseGraphService):
             # Fallback implementation would go here
             pass
 
+    def _create_influence_relationships_batch(self, relationships):
+        """Helper method to create several influence relationships at once"""
+        if self.influence_service:
+            return self.influence_service.create_influence_relationships_batch(
+                relationships
+            )
+        else:
+            # Fallback implementation would go here
+            pass
+
     def _create_influence_relationship(self, **kwargs):
         """Helper method to create influence relationship"""
         if self.influence_service:
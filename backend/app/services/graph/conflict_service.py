@@ -20,38 +20,44 @@ class ConflictService(BaseGraphService):
 
     def find_comprehensive_conflicts(self, new_data: StructuredOutput) -> Dict:
         """Find conflicts for main item AND all influences"""
-        conflicts = {
-            "main_item_conflicts": [],
-            "influence_conflicts": {},
-            "total_conflicts": 0,
-        }
+        main_conflicts = self.find_main_item_conflicts(new_data)
+        influence_conflicts = self.find_influence_conflicts(new_data)
 
-        # Check main item conflicts
-        main_conflicts = self._find_similar_items(
-            new_data.main_item, new_data.main_item_creator
+        total_conflicts = len(main_conflicts) + sum(
+            len(conflict["similar_items"]) for conflict in influence_conflicts.values()
         )
-        conflicts["main_item_conflicts"] = main_conflicts
-        conflicts["total_conflicts"] += len(main_conflicts)
 
-        # Check each influence for conflicts
+        return {
+            "main_item_conflicts": main_conflicts,
+            "influence_conflicts": influence_conflicts,
+            "total_conflicts": total_conflicts,
+        }
+
+    def find_main_item_conflicts(self, new_data: StructuredOutput) -> List[Dict]:
+        """Find existing items that conflict with the main item"""
+        return self._find_similar_items(new_data.main_item, new_data.main_item_creator)
+
+    def find_influence_conflicts(self, new_data: StructuredOutput) -> Dict[int, Dict]:
+        """Find existing items that conflict with each influence, keyed by index"""
+        influence_conflicts = {}
+
         for i, influence in enumerate(new_data.influences):
             influence_name = str(influence.name).strip()
             if not influence_name or influence_name.lower() in ["none", "null", ""]:
                 continue
 
-            influence_conflicts = self._find_similar_items(
+            similar_items = self._find_similar_items(
                 influence_name, influence.creator_name
             )
 
-            if influence_conflicts:
-                conflicts["influence_conflicts"][i] = {
+            if similar_items:
+                influence_conflicts[i] = {
                     "influence": influence,
-                    "similar_items": influence_conflicts,
+                    "similar_items": similar_items,
                     "influence_index": i,
                 }
-                conflicts["total_conflicts"] += len(influence_conflicts)
 
-        return conflicts
+        return influence_conflicts
 
     def get_item_preview(self, item_id: str) -> Dict:
         """Get existing item data for merge preview"""
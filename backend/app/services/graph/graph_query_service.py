@@ -67,8 +67,8 @@ class GraphQueryService(BaseGraphService):
                 relation = record["r"]
                 creator_node = record.get("creator")
 
-                # Build influence item
-                influence_item = Item(
+                # Build influence item (trusted database row, so skip re-validation)
+                influence_item = Item.model_construct(
                     id=influence_node["id"],
                     name=influence_node["name"],
                     description=influence_node.get("description"),
@@ -81,7 +81,7 @@ class GraphQueryService(BaseGraphService):
                 )
 
                 # Build influence relationship with scope
-                influence_relation = InfluenceRelation(
+                influence_relation = InfluenceRelation.model_construct(
                     from_item=influence_item,
                     to_item=main_item,
                     confidence=relation["confidence"],
@@ -120,14 +120,14 @@ class GraphQueryService(BaseGraphService):
             creators = []
             for record in result:
                 creator_node = record["creator"]
-                creator = Creator(
+                creator = Creator.model_construct(
                     id=creator_node["id"],
                     name=creator_node["name"],
                     type=creator_node["type"],
                 )
                 creators.append(creator)
 
-            return GraphResponse(
+            return GraphResponse.model_construct(
                 main_item=main_item,
                 influences=influences,
                 categories=categories,
@@ -156,7 +156,7 @@ class GraphQueryService(BaseGraphService):
                 relation = record["r"]
                 creator_node = record.get("creator")
 
-                influenced_item = Item(
+                influenced_item = Item.model_construct(
                     id=influenced_node["id"],
                     name=influenced_node["name"],
                     auto_detected_type=influenced_node.get("auto_detected_type"),
@@ -169,7 +169,7 @@ class GraphQueryService(BaseGraphService):
                 )
 
                 # Note: reversed relationship for "what this influences"
-                influence_relation = InfluenceRelation(
+                influence_relation = InfluenceRelation.model_construct(
                     from_item=main_item,
                     to_item=influenced_item,
                     confidence=relation["confidence"],
@@ -183,6 +183,83 @@ class GraphQueryService(BaseGraphService):
 
             return influences
 
+    def get_merge_verification(self, old_item_id: str, new_item_id: str) -> Dict:
+        """Check the outcome of a merge in one query.
+
+        Returns whether the merged-away item still exists, the surviving item
+        and the influences now pointing at it.
+        """
+        with neo4j_db.driver.session() as session:
+            record = session.run(
+                """
+                OPTIONAL MATCH (old:Item {id: $old_id})
+                WITH old IS NOT NULL AS old_exists
+                OPTIONAL MATCH (new:Item {id: $new_id})
+                OPTIONAL MATCH (influence:Item)-[r:INFLUENCES]->(new)
+                WITH old_exists, new, influence, r
+                ORDER BY influence.year ASC
+                RETURN old_exists, new,
+                       collect(CASE WHEN influence IS NULL THEN null
+                               ELSE {influence: influence, r: r} END) AS influences
+                """,
+                {"old_id": old_item_id, "new_id": new_item_id},
+            ).single()
+
+            new_node = record["new"]
+            if new_node is None:
+                return {
+                    "old_exists": record["old_exists"],
+                    "new_item": None,
+                    "influences": [],
+                }
+
+            new_item = Item.model_construct(
+                id=new_node["id"],
+                name=new_node["name"],
+                description=new_node.get("description"),
+                year=new_node.get("year"),
+                auto_detected_type=new_node.get("auto_detected_type"),
+                confidence_score=new_node.get("confidence_score"),
+                verification_status=new_node.get("verification_status", "ai_generated"),
+            )
+
+            influences = []
+            for entry in record["influences"]:
+                influence_node = entry["influence"]
+                relation = entry["r"]
+
+                influence_item = Item.model_construct(
+                    id=influence_node["id"],
+                    name=influence_node["name"],
+                    description=influence_node.get("description"),
+                    year=influence_node.get("year"),
+                    auto_detected_type=influence_node.get("auto_detected_type"),
+                    confidence_score=influence_node.get("confidence_score"),
+                    verification_status=influence_node.get(
+                        "verification_status", "ai_generated"
+                    ),
+                )
+
+                influences.append(
+                    InfluenceRelation.model_construct(
+                        from_item=influence_item,
+                        to_item=new_item,
+                        confidence=relation["confidence"],
+                        influence_type=relation["influence_type"],
+                        explanation=relation["explanation"],
+                        category=relation["category"],
+                        scope=relation.get("scope"),
+                        source=relation.get("source"),
+                        clusters=relation.get("clusters", []),
+                    )
+                )
+
+            return {
+                "old_exists": record["old_exists"],
+                "new_item": new_item,
+                "influences": influences,
+            }
+
     def get_expansion_counts(self, item_id: str) -> Dict[str, int]:
         """Get counts for potential expansions (incoming and outgoing influences)"""
         with neo4j_db.driver.session() as session:
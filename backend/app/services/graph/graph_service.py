@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import List, Optional, Dict, Any, Tuple
 from app.models.item import Item, Creator, InfluenceRelation, GraphResponse
 from app.models.structured import StructuredOutput
 from app.models.enhancement import EnhancedContent
@@ -62,6 +63,18 @@ class GraphService(BaseGraphService):
         """Create a new item in the database"""
         return self.item_service.create_item(*args, **kwargs)
 
+    async def acreate_item(self, *args, **kwargs) -> Item:
+        """Create a new item without blocking the event loop"""
+        return await asyncio.to_thread(self.item_service.create_item, *args, **kwargs)
+
+    def create_items_batch(self, items: List[Dict]) -> List[Item]:
+        """Create several items in a single round-trip"""
+        return self.item_service.create_items_batch(items)
+
+    def batch_session(self):
+        """Context manager yielding item operations that share one session"""
+        return self.item_service.batch_session()
+
     def get_item_by_id(self, item_id: str) -> Optional[Item]:
         """Get single item by ID"""
         return self.item_service.get_item_by_id(item_id)
@@ -70,19 +83,35 @@ class GraphService(BaseGraphService):
         """Search items by name"""
         return self.item_service.search_items(query)
 
+    def search_items_multi(self, queries: List[str]) -> Dict[str, List[Item]]:
+        """Search items by name for several queries at once, keyed by query"""
+        return self.item_service.search_items_multi(queries)
+
     def find_similar_items(self, name: str, creator_name: str = None) -> List[Dict]:
         """Find existing items that might be the same as what user wants to create"""
         return self.item_service.find_similar_items(name, creator_name)
 
+    def find_similar_items_batch(self, queries: List[Dict]) -> Dict[int, List[Dict]]:
+        """Run several similar-item lookups in one round-trip, keyed by query index"""
+        return self.item_service.find_similar_items_batch(queries)
+
     def delete_item_completely(self, item_id: str) -> bool:
         """Delete item and all its relationships"""
         return self.item_service.delete_item_completely(item_id)
 
+    def delete_items_bulk(self, item_ids: List[str]) -> int:
+        """Delete several items and all their relationships in one round-trip"""
+        return self.item_service.delete_items_bulk(item_ids)
+
+    def delete_items_apoc(self, item_ids: List[str], batch_size: int = 1000) -> int:
+        """Delete items in server-side APOC batches, falling back to delete_items_bulk"""
+        return self.item_service.delete_items_apoc(item_ids, batch_size)
+
     def update_item(self, item_id: str, update_data: dict) -> Optional[Item]:
         """Update an existing item with new data"""
         return self.item_service.update_item(item_id, update_data)
 
-    def merge_items(self, source_item_id: str, target_item_id: str) -> str:
+    def merge_items(self, source_item_id: str, target_item_id: str) -> Tuple[str, bool]:
         """Transfer all relationships from source to target, delete source"""
         return self.item_service.merge_items(source_item_id, target_item_id)
 
@@ -108,6 +137,18 @@ class GraphService(BaseGraphService):
         """Create influence relationship between items with scope support"""
         return self.influence_service.create_influence_relationship(*args, **kwargs)
 
+    async def acreate_influence_relationship(self, *args, **kwargs):
+        """Create an influence relationship without blocking the event loop"""
+        return await asyncio.to_thread(
+            self.influence_service.create_influence_relationship, *args, **kwargs
+        )
+
+    def create_influence_relationships_batch(self, relationships: List[Dict]) -> int:
+        """Create several influence relationships in a single round-trip"""
+        return self.influence_service.create_influence_relationships_batch(
+            relationships
+        )
+
     # ============================================================================
     # SECTION 5: GRAPH QUERY OPERATIONS (delegated to GraphQueryService)
     # ============================================================================
@@ -120,6 +161,10 @@ class GraphService(BaseGraphService):
         """Get what this item influences (outgoing influences)"""
         return self.graph_query_service.get_what_item_influences(item_id)
 
+    def get_merge_verification(self, old_item_id: str, new_item_id: str) -> Dict:
+        """Check the outcome of a merge in one query"""
+        return self.graph_query_service.get_merge_verification(old_item_id, new_item_id)
+
     def get_expansion_counts(self, item_id: str) -> Dict[str, int]:
         """Get counts for potential expansions (incoming and outgoing influences)"""
         return self.graph_query_service.get_expansion_counts(item_id)
@@ -148,6 +193,14 @@ class GraphService(BaseGraphService):
         """Find conflicts for main item AND all influences"""
         return self.conflict_service.find_comprehensive_conflicts(new_data)
 
+    def find_main_item_conflicts(self, new_data: StructuredOutput) -> List[Dict]:
+        """Find conflicts for the main item only"""
+        return self.conflict_service.find_main_item_conflicts(new_data)
+
+    def find_influence_conflicts(self, new_data: StructuredOutput) -> Dict[int, Dict]:
+        """Find conflicts for each influence only, keyed by influence index"""
+        return self.conflict_service.find_influence_conflicts(new_data)
+
     def get_comprehensive_preview(self, conflict_data: Dict) -> Dict:
         """Get preview data for main item and all conflicting influences"""
         return self.conflict_service.get_comprehensive_preview(conflict_data)
@@ -160,6 +213,16 @@ class GraphService(BaseGraphService):
         """Save complete structured influence data to database with scope support"""
         return self.bulk_service.save_structured_influences(structured_data)
 
+    def save_structured_influences_bulk(
+        self, structured_outputs: List[StructuredOutput]
+    ) -> List[str]:
+        """Save several structured outputs in a single write transaction"""
+        return self.bulk_service.save_structured_influences_bulk(structured_outputs)
+
+    def create_items_and_edge(self, items: List[Dict], edge: Dict) -> Dict[str, str]:
+        """Create several items and one influence between them in one transaction"""
+        return self.bulk_service.create_items_and_edge(items, edge)
+
     # ============================================================================
     # SECTION 8: ENHANCED CONTENT OPERATIONS
     # ============================================================================
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from app.core.database.neo4j import neo4j_db
 from .base_service import BaseGraphService
 
@@ -58,3 +58,50 @@ class InfluenceService(BaseGraphService):
 
         except Exception as e:
             raise  # Re-raise the exception
+
+    def create_influence_relationships_batch(self, relationships: List[Dict]) -> int:
+        """Create several influence relationships in a single UNWIND query.
+
+        Each dict takes the same fields as create_influence_relationship.
+        Returns the number of relationships written.
+        """
+        if not relationships:
+            return 0
+
+        rows = [
+            {
+                "from_id": rel["from_item_id"],
+                "to_id": rel["to_item_id"],
+                "confidence": rel["confidence"],
+                "influence_type": rel["influence_type"],
+                "explanation": rel["explanation"],
+                "category": rel["category"],
+                "scope": rel.get("scope", "macro"),
+                "source": rel.get("source"),
+                "year_of_influence": rel.get("year_of_influence"),
+                "clusters": rel.get("clusters"),
+            }
+            for rel in relationships
+        ]
+
+        with neo4j_db.driver.session() as session:
+            result = session.run(
+                """
+                UNWIND $rels AS rel
+                MATCH (from:Item {id: rel.from_id})
+                MATCH (to:Item {id: rel.to_id})
+                MERGE (from)-[r:INFLUENCES]->(to)
+                SET r.confidence = rel.confidence,
+                    r.influence_type = rel.influence_type,
+                    r.explanation = rel.explanation,
+                    r.category = rel.category,
+                    r.scope = rel.scope,
+                    r.source = rel.source,
+                    r.year_of_influence = rel.year_of_influence,
+                    r.clusters = rel.clusters,
+                    r.created_at = datetime()
+                RETURN count(r) as created
+                """,
+                {"rels": rows},
+            )
+            return result.single()["created"]
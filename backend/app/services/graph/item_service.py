@@ -1,7 +1,9 @@
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from neo4j.exceptions import ClientError
 from app.core.database.neo4j import neo4j_db
 from app.models.item import Item
-from .base_service import BaseGraphService
+from .base_service import SIMILARITY_STOP_WORDS, BaseGraphService
 
 
 class ItemService(BaseGraphService):
@@ -23,47 +25,128 @@ class ItemService(BaseGraphService):
     ) -> Item:
         """Create a new item in the database"""
         try:
-            item_id = self.generate_id(name, auto_detected_type)
+            with neo4j_db.driver.session() as session:
+                return self._create_item_in_session(
+                    session,
+                    name=name,
+                    auto_detected_type=auto_detected_type,
+                    year=year,
+                    description=description,
+                    confidence_score=confidence_score,
+                    verification_status=verification_status,
+                )
+
+        except Exception as e:
+            raise Exception(f"Failed to create item: {str(e)}")
+
+    def create_items_batch(self, items: List[Dict]) -> List[Item]:
+        """Create several items in a single UNWIND query.
+
+        Each dict takes the same fields as create_item; the created items are
+        returned in input order.
+        """
+        if not items:
+            return []
+
+        rows = [
+            {
+                "verification_status": "ai_generated",
+                **item,
+                "id": self.generate_id(item["name"], item.get("auto_detected_type")),
+                "name_tokens": self.name_tokens(item["name"]),
+            }
+            for item in items
+        ]
 
+        try:
             with neo4j_db.driver.session() as session:
                 result = session.run(
                     """
-                    CREATE (i:Item {
-                        id: $id,
-                        name: $name,
-                        auto_detected_type: $auto_detected_type,
-                        year: $year,
-                        description: $description,
-                        confidence_score: $confidence_score,
-                        verification_status: $verification_status,
-                        created_at: datetime()
-                    })
+                    UNWIND $items AS item
+                    CREATE (i:Item)
+                    SET i += item,
+                        i.name_lc = toLower(item.name),
+                        i.created_at = datetime()
                     RETURN i
                     """,
-                    {
-                        "id": item_id,
-                        "name": name,
-                        "auto_detected_type": auto_detected_type,
-                        "year": year,
-                        "description": description,
-                        "confidence_score": confidence_score,
-                        "verification_status": verification_status,
-                    },
+                    {"items": rows},
                 )
 
-                item_data = result.single()["i"]
-                return Item(
-                    id=item_data["id"],
-                    name=item_data["name"],
-                    auto_detected_type=item_data.get("auto_detected_type"),
-                    year=item_data.get("year"),
-                    description=item_data.get("description"),
-                    confidence_score=item_data.get("confidence_score"),
-                    verification_status=item_data.get("verification_status"),
-                )
+                return [
+                    Item(
+                        id=node["id"],
+                        name=node["name"],
+                        auto_detected_type=node.get("auto_detected_type"),
+                        year=node.get("year"),
+                        description=node.get("description"),
+                        confidence_score=node.get("confidence_score"),
+                        verification_status=node.get(
+                            "verification_status", "ai_generated"
+                        ),
+                    )
+                    for node in (record["i"] for record in result)
+                ]
 
         except Exception as e:
-            raise Exception(f"Failed to create item: {str(e)}")
+            raise Exception(f"Failed to create items: {str(e)}")
+
+    @contextmanager
+    def batch_session(self):
+        """Yield an ItemBatchSession that runs item operations on one session"""
+        with neo4j_db.driver.session() as session:
+            yield ItemBatchSession(self, session)
+
+    def _create_item_in_session(
+        self,
+        session,
+        name: str,
+        auto_detected_type: str = None,
+        year: int = None,
+        description: str = None,
+        confidence_score: float = None,
+        verification_status: str = "ai_generated",
+    ) -> Item:
+        """Run the item CREATE query on an already open session"""
+        item_id = self.generate_id(name, auto_detected_type)
+
+        result = session.run(
+            """
+            CREATE (i:Item {
+                id: $id,
+                name: $name,
+                name_lc: toLower($name),
+                name_tokens: $name_tokens,
+                auto_detected_type: $auto_detected_type,
+                year: $year,
+                description: $description,
+                confidence_score: $confidence_score,
+                verification_status: $verification_status,
+                created_at: datetime()
+            })
+            RETURN i
+            """,
+            {
+                "id": item_id,
+                "name": name,
+                "name_tokens": self.name_tokens(name),
+                "auto_detected_type": auto_detected_type,
+                "year": year,
+                "description": description,
+                "confidence_score": confidence_score,
+                "verification_status": verification_status,
+            },
+        )
+
+        item_data = result.single()["i"]
+        return Item(
+            id=item_data["id"],
+            name=item_data["name"],
+            auto_detected_type=item_data.get("auto_detected_type"),
+            year=item_data.get("year"),
+            description=item_data.get("description"),
+            confidence_score=item_data.get("confidence_score"),
+            verification_status=item_data.get("verification_status"),
+        )
 
     def get_item_by_id(self, item_id: str) -> Optional[Item]:
         """Get single item by ID"""
@@ -91,14 +174,13 @@ class ItemService(BaseGraphService):
             result = session.run(
                 """
                 MATCH (i:Item)
-                WHERE toLower(i.name) CONTAINS toLower($query)
-                OPTIONAL MATCH (i)-[:CREATED_BY]->(c:Creator)
-                WHERE toLower(c.name) CONTAINS toLower($query)
-                RETURN DISTINCT i
+                WHERE i.name_lc CONTAINS $query
+                RETURN i
                 ORDER BY i.name
                 LIMIT 10
                 """,
-                {"query": query},
+                # Lowercase the term once here rather than per row in Cypher
+                {"query": query.lower()},
             )
 
             items = []
@@ -117,51 +199,115 @@ class ItemService(BaseGraphService):
 
             return items
 
+    def search_items_multi(self, queries: List[str]) -> Dict[str, List[Item]]:
+        """Search items by name for several queries in a single round-trip"""
+        if not queries:
+            return {}
+
+        with neo4j_db.driver.session() as session:
+            result = session.run(
+                """
+                UNWIND $queries AS query
+                CALL {
+                    WITH query
+                    MATCH (i:Item)
+                    WHERE i.name_lc CONTAINS toLower(query)
+                    RETURN i
+                    ORDER BY i.name
+                    LIMIT 10
+                }
+                RETURN query, collect(i) as items
+                """,
+                {"queries": list(queries)},
+            )
+
+            # Queries without matches produce no row, so seed every key up front
+            items_by_query = {query: [] for query in queries}
+            for record in result:
+                items_by_query[record["query"]] = [
+                    Item(
+                        id=node["id"],
+                        name=node["name"],
+                        description=node.get("description"),
+                        year=node.get("year"),
+                        auto_detected_type=node.get("auto_detected_type"),
+                        confidence_score=node.get("confidence_score"),
+                        verification_status=node.get(
+                            "verification_status", "ai_generated"
+                        ),
+                    )
+                    for node in record["items"]
+                ]
+
+            return items_by_query
+
     def find_similar_items(self, name: str, creator_name: str = None) -> List[dict]:
         """Find existing items that might be the same as what user wants to create"""
-        with neo4j_db.driver.session() as session:
-            # Normalize the search name for better matching
-            normalized_search_name = self._normalize_text(name)
+        return self.find_similar_items_batch(
+            [{"name": name, "creator_name": creator_name}]
+        )[0]
+
+    def find_similar_items_batch(self, queries: List[Dict]) -> Dict[int, List[dict]]:
+        """Run several find_similar_items lookups in a single query.
 
-            # Word-based matching with stop word filtering
+        Each query is a dict with ``name`` and optional ``creator_name``.
+        Returns the similar items for each query keyed by its index.
+        """
+        normalized_names = [self._normalize_text(q["name"]) for q in queries]
+        similar_by_query = {idx: [] for idx in range(len(queries))}
+        if not queries:
+            return similar_by_query
+
+        with neo4j_db.driver.session() as session:
+            # Word-based matching with stop word filtering, run per query
             fuzzy_query = """
-            MATCH (i:Item) 
-            OPTIONAL MATCH (i)-[:CREATED_BY]->(c:Creator)
-            WITH i, collect(c.name) as creators, 
-                 [word IN split(toLower(i.name), ' ') WHERE size(word) >= 3 AND NOT word IN ['the', 'and', 'of', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'a', 'an', 'as', 'is', 'it', 'that', 'this', 'was', 'will', 'be', 'have', 'had', 'has', 'do', 'does', 'did', 'or', 'but', 'not', 'so', 'if', 'then', 'else', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'only', 'own', 'same', 'than', 'too', 'very', 'can', 'may', 'must', 'shall', 'should', 'would', 'could']] as item_words
-            WITH i, creators, item_words, split($normalized_search_name, ' ') as search_words
-            WITH i, creators, item_words, 
-                 [word IN search_words WHERE size(word) >= 3 AND NOT word IN ['the', 'and', 'of', 'in', 'on', 'at', 'to', 'for', 'with', 'by', 'a', 'an', 'as', 'is', 'it', 'that', 'this', 'was', 'will', 'be', 'have', 'had', 'has', 'do', 'does', 'did', 'or', 'but', 'not', 'so', 'if', 'then', 'else', 'when', 'where', 'why', 'how', 'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such', 'no', 'nor', 'only', 'own', 'same', 'than', 'too', 'very', 'can', 'may', 'must', 'shall', 'should', 'would', 'could']] as filtered_search_words
-            WITH i, creators, item_words, filtered_search_words,
-                 size([word IN filtered_search_words WHERE word IN item_words]) as matches,
-                 size(filtered_search_words) as total_search_words
-            WHERE (matches > 0 AND matches >= total_search_words * 0.6)
-            OR (toLower(i.name) = toLower($normalized_search_name))
-            OR (toLower(i.name) CONTAINS toLower($normalized_search_name) AND size($normalized_search_name) >= 4)
-            OR (toLower($normalized_search_name) CONTAINS toLower(i.name) AND size(i.name) >= 4)
-            OR ($creator_name IS NOT NULL AND $creator_name <> '' 
-                AND any(creator IN creators WHERE toLower(creator) CONTAINS toLower($creator_name)))
-            RETURN i, creators, item_words, filtered_search_words, matches, total_search_words
-            ORDER BY matches DESC, total_search_words ASC
-            LIMIT 5
+            UNWIND $queries AS q
+            CALL {
+                WITH q
+                MATCH (i:Item)
+                OPTIONAL MATCH (i)-[:CREATED_BY]->(c:Creator)
+                WITH q, i, collect(c.name) as creators,
+                     coalesce(
+                         i.name_tokens,
+                         [word IN split(i.name_lc, ' ') WHERE size(word) >= 3 AND NOT word IN $stop_words]
+                     ) as item_words
+                WITH q, i, creators, item_words,
+                     size([word IN q.search_tokens WHERE word IN item_words]) as matches,
+                     size(q.search_tokens) as total_search_words
+                WHERE (matches > 0 AND matches >= total_search_words * 0.6)
+                OR (i.name_lc = q.normalized_search_name)
+                OR (i.name_lc CONTAINS q.normalized_search_name AND size(q.normalized_search_name) >= 4)
+                OR (q.normalized_search_name CONTAINS i.name_lc AND size(i.name) >= 4)
+                OR (q.creator_name IS NOT NULL AND q.creator_name <> ''
+                    AND any(creator IN creators WHERE toLower(creator) CONTAINS toLower(q.creator_name)))
+                RETURN i, creators, matches, total_search_words,
+                       size([(:Item)-[:INFLUENCES]->(i) | 1]) as influence_count
+                ORDER BY matches DESC, total_search_words ASC
+                LIMIT 5
+            }
+            RETURN q.idx as idx, i, creators, matches, total_search_words, influence_count
             """
 
             results = session.run(
                 fuzzy_query,
                 {
-                    "name": name,
-                    "normalized_search_name": normalized_search_name,
-                    "creator_name": creator_name or "",
+                    "queries": [
+                        {
+                            "idx": idx,
+                            "normalized_search_name": normalized_names[idx],
+                            "search_tokens": self.search_tokens(normalized_names[idx]),
+                            "creator_name": q.get("creator_name") or "",
+                        }
+                        for idx, q in enumerate(queries)
+                    ],
+                    "stop_words": list(SIMILARITY_STOP_WORDS),
                 },
             )
 
-            similar_items = []
-
             for record in results:
+                idx = record["idx"]
                 node = record["i"]
                 creators = record["creators"]
-                item_words = record["item_words"]
-                filtered_search_words = record["filtered_search_words"]
                 matches = record["matches"]
                 total_search_words = record["total_search_words"]
 
@@ -173,7 +319,7 @@ class ItemService(BaseGraphService):
 
                 # Calculate final score based on different matching criteria
                 item_name_normalized = self._normalize_text(node["name"])
-                search_name_normalized = normalized_search_name
+                search_name_normalized = normalized_names[idx]
 
                 if item_name_normalized == search_name_normalized:
                     score = 100
@@ -192,12 +338,6 @@ class ItemService(BaseGraphService):
                 else:
                     score = 0
 
-                # Get existing influences count
-                influence_count = session.run(
-                    "MATCH (:Item)-[:INFLUENCES]->(i:Item {id: $id}) RETURN count(*) as count",
-                    {"id": node["id"]},
-                ).single()["count"]
-
                 item_data = {
                     "id": node["id"],
                     "name": node["name"],
@@ -207,55 +347,114 @@ class ItemService(BaseGraphService):
                     "confidence_score": node.get("confidence_score"),
                     "verification_status": node.get("verification_status"),
                     "creators": [c for c in creators if c],
-                    "existing_influences_count": influence_count,
+                    "existing_influences_count": record["influence_count"],
                     "similarity_score": score,
                 }
-                similar_items.append(item_data)
+                similar_by_query[idx].append(item_data)
 
-            return similar_items
+            return similar_by_query
 
     def delete_item_completely(self, item_id: str) -> bool:
         """Delete item and all its relationships"""
+        with neo4j_db.driver.session() as session:
+            return self._delete_item_in_session(session, item_id)
+
+    def _delete_item_in_session(self, session, item_id: str) -> bool:
+        """Run the item DETACH DELETE query on an already open session"""
+        try:
+            # Delete all relationships first, then the item
+            session.run(
+                """
+                MATCH (i:Item {id: $item_id})
+                DETACH DELETE i
+                """,
+                {"item_id": item_id},
+            )
+            return True
+        except Exception as e:
+            raise Exception(f"Failed to delete item: {str(e)}")
+
+    def delete_items_bulk(self, item_ids: List[str]) -> int:
+        """Delete several items and all their relationships in a single query"""
+        if not item_ids:
+            return 0
+
         with neo4j_db.driver.session() as session:
             try:
-                # Delete all relationships first, then the item
-                session.run(
+                result = session.run(
                     """
-                    MATCH (i:Item {id: $item_id})
+                    UNWIND $item_ids AS item_id
+                    MATCH (i:Item {id: item_id})
                     DETACH DELETE i
+                    RETURN count(i) as deleted
                     """,
-                    {"item_id": item_id},
+                    {"item_ids": list(dict.fromkeys(item_ids))},
                 )
-                return True
+                return result.single()["deleted"]
             except Exception as e:
-                raise Exception(f"Failed to delete item: {str(e)}")
+                raise Exception(f"Failed to delete items: {str(e)}")
+
+    def delete_items_apoc(self, item_ids: List[str], batch_size: int = 1000) -> int:
+        """Delete items in server-side batches with apoc.periodic.iterate.
+
+        Falls back to delete_items_bulk when APOC is not installed.
+        """
+        if not item_ids:
+            return 0
+
+        item_ids = list(dict.fromkeys(item_ids))
+
+        try:
+            with neo4j_db.driver.session() as session:
+                record = session.run(
+                    """
+                    CALL apoc.periodic.iterate(
+                        "MATCH (i:Item) WHERE i.id IN $ids RETURN i",
+                        "DETACH DELETE i",
+                        {batchSize: $batch_size, params: {ids: $ids}}
+                    )
+                    YIELD committedOperations, errorMessages
+                    RETURN committedOperations, errorMessages
+                    """,
+                    {"ids": item_ids, "batch_size": batch_size},
+                ).single()
+        except ClientError as e:
+            # Only fall back when APOC isn't installed on this server; anything
+            # else (auth, constraints, connection loss) is a real failure
+            if e.code != "Neo.ClientError.Procedure.ProcedureNotFound":
+                raise
+            return self.delete_items_bulk(item_ids)
+
+        if record["errorMessages"]:
+            raise Exception(f"Failed to delete items: {record['errorMessages']}")
+        return record["committedOperations"]
 
     def update_item(self, item_id: str, update_data: dict) -> Optional[Item]:
         """Update an existing item with new data"""
         with neo4j_db.driver.session() as session:
             try:
-                # Build dynamic SET clause for only provided fields
-                set_clauses = []
-                params = {"item_id": item_id}
-
-                for field, value in update_data.items():
-                    if value is not None:  # Only update non-None values
-                        set_clauses.append(f"i.{field} = ${field}")
-                        params[field] = value
+                # Only update non-None values; one parameterized map keeps the
+                # query text (and its cached plan) identical for any field set
+                props = {
+                    field: value
+                    for field, value in update_data.items()
+                    if value is not None
+                }
 
-                if not set_clauses:
+                if not props:
                     # No fields to update, just return the item
                     return self.get_item_by_id(item_id)
 
-                set_clause = ", ".join(set_clauses)
+                if "name" in props:
+                    props["name_tokens"] = self.name_tokens(props["name"])
 
                 result = session.run(
-                    f"""
-                    MATCH (i:Item {{id: $item_id}})
-                    SET {set_clause}
+                    """
+                    MATCH (i:Item {id: $item_id})
+                    SET i += $props, i.name_lc = toLower(i.name)
                     RETURN i
                     """,
-                    params,
+                    {"item_id": item_id, "props": props},
                 )
 
                 record = result.single()
@@ -277,8 +476,11 @@ class ItemService(BaseGraphService):
             except Exception as e:
                 raise Exception(f"Failed to update item: {str(e)}")
 
-    def merge_items(self, source_item_id: str, target_item_id: str) -> str:
-        """Transfer all relationships from source to target, delete source"""
+    def merge_items(self, source_item_id: str, target_item_id: str) -> Tuple[str, bool]:
+        """Transfer all relationships from source to target, delete source.
+
+        Returns the target id and whether a source item existed (and was deleted).
+        """
         with neo4j_db.driver.session() as session:
             try:
                 # Transfer incoming influences (what influenced source -> what influenced target)
@@ -308,12 +510,16 @@ class ItemService(BaseGraphService):
                 )
 
                 # Delete the source item
-                session.run(
-                    "MATCH (source:Item {id: $source_id}) DETACH DELETE source",
+                deleted = session.run(
+                    """
+                    MATCH (source:Item {id: $source_id})
+                    DETACH DELETE source
+                    RETURN count(source) as deleted
+                    """,
                     {"source_id": source_item_id},
-                )
+                ).single()["deleted"]
 
-                return target_item_id
+                return target_item_id, deleted > 0
 
             except Exception as e:
                 raise Exception(f"Failed to merge items: {str(e)}")
@@ -344,3 +550,45 @@ class ItemService(BaseGraphService):
         normalized = normalized.strip()
 
         return normalized
+
+
+class ItemBatchSession:
+    """
+    Item operations bound to a single open Neo4j session.
+
+    Obtained from ItemService.batch_session(). Each query still auto-commits,
+    so other sessions (e.g. conflict detection) see the writes immediately,
+    but the session is acquired once instead of per call. Like the underlying
+    driver session, it must not be used from several threads at once.
+    """
+
+    def __init__(self, item_service: ItemService, session):
+        self._item_service = item_service
+        self._session = session
+
+    def create_item(
+        self,
+        name: str,
+        auto_detected_type: str = None,
+        year: int = None,
+        description: str = None,
+        confidence_score: float = None,
+        verification_status: str = "ai_generated",
+    ) -> Item:
+        """Create a new item on this session"""
+        try:
+            return self._item_service._create_item_in_session(
+                self._session,
+                name=name,
+                auto_detected_type=auto_detected_type,
+                year=year,
+                description=description,
+                confidence_score=confidence_score,
+                verification_status=verification_status,
+            )
+        except Exception as e:
+            raise Exception(f"Failed to create item: {str(e)}")
+
+    def delete_item_completely(self, item_id: str) -> bool:
+        """Delete item and all its relationships on this session"""
+        return self._item_service._delete_item_in_session(self._session, item_id)
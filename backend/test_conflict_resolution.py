@@ -45,11 +45,10 @@ class ConflictResolutionTester:
 
     def cleanup_test_data(self, item_ids: List[str]):
         """Clean up test data"""
-        for item_id in item_ids:
-            try:
-                self.graph_service.delete_item_completely(item_id)
-            except Exception as e:
-                print(f"Warning: Could not delete {item_id}: {e}")
+        try:
+            self.graph_service.delete_items_bulk(item_ids)
+        except Exception as e:
+            print(f"Warning: Could not delete {item_ids}: {e}")
 
     def test_1_item_to_item_merge(self):
         """Test main item conflict resolution"""
@@ -542,9 +541,7 @@ class ConflictResolutionTester:
 
         except Exception as e:
             print(f"❌ Test execution failed: {e}")
-            import traceback
-
-            traceback.print_exc()
+            logger.exception("Test execution failed")
 
         # Print summary
         print("\n" + "=" * 60)
@@ -7,9 +7,14 @@ including all merge scenarios, edge cases, error conditions, and performance.
 """
 
 import asyncio
+import concurrent.futures
+import statistics
 import time
 import logging
-from typing import Dict, List, Any, Optional
+import sys
+from array import array
+from typing import Dict, List, Any, Optional, Tuple
+from app.core.database.neo4j import neo4j_db
 from app.services.graph.graph_service import graph_service
 from app.models.structured import StructuredOutput, StructuredInfluence
 
@@ -18,22 +23,173 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Edge-case inputs for test 3 (empty/null data), built once per process
+_EDGE_CASE_FIXTURES: List[Tuple[str, StructuredOutput]] = [
+    (
+        "Empty main item",
+        StructuredOutput(
+            main_item="",
+            main_item_type="album",
+            main_item_creator="",
+            influences=[],
+            categories=[],
+        ),
+    ),
+    (
+        "Null creator",
+        StructuredOutput(
+            main_item="Test Item",
+            main_item_type="album",
+            main_item_creator=None,
+            influences=[],
+            categories=[],
+        ),
+    ),
+    (
+        "Empty influences",
+        StructuredOutput(
+            main_item="Test Item",
+            main_item_type="album",
+            main_item_creator="Artist",
+            influences=[],
+            categories=[],
+        ),
+    ),
+    (
+        "Invalid influence names",
+        StructuredOutput(
+            main_item="Test Item",
+            main_item_type="album",
+            main_item_creator="Artist",
+            influences=[
+                StructuredInfluence(
+                    name="",
+                    type="album",
+                    creator_name="Artist",
+                    year=2020,
+                    category="Test",
+                    influence_type="inspiration",
+                    confidence=0.8,
+                    explanation="Test",
+                ),
+                StructuredInfluence(
+                    name="None",
+                    type="album",
+                    creator_name="Artist",
+                    year=2020,
+                    category="Test",
+                    influence_type="inspiration",
+                    confidence=0.8,
+                    explanation="Test",
+                ),
+            ],
+            categories=["Test"],
+        ),
+    ),
+]
+
+
+# Invalid (but valid Pydantic types) inputs for test 6, built once per process
+_ERROR_RECOVERY_FIXTURES: List[Tuple[str, StructuredOutput]] = [
+    (
+        "Empty main item name",
+        StructuredOutput(
+            main_item="",  # Empty string instead of None
+            main_item_type="album",
+            main_item_creator="Artist",
+            influences=[],
+            categories=[],
+        ),
+    ),
+    (
+        "Very long item name",
+        StructuredOutput(
+            main_item="A" * 1000,  # Very long name
+            main_item_type="album",
+            main_item_creator="Artist",
+            influences=[],
+            categories=[],
+        ),
+    ),
+    (
+        "Empty influence name",
+        StructuredOutput(
+            main_item="Test Item",
+            main_item_type="album",
+            main_item_creator="Artist",
+            influences=[
+                StructuredInfluence(
+                    name="",  # Empty influence name
+                    type="album",
+                    creator_name="Artist",
+                    year=2020,
+                    category="Test",
+                    influence_type="inspiration",
+                    confidence=0.8,  # Valid confidence
+                    explanation="Test",
+                )
+            ],
+            categories=["Test"],
+        ),
+    ),
+]
+
+
 class ProductionConflictResolutionTester:
     def __init__(self):
         self.graph_service = graph_service
         self.conflict_service = self.graph_service.conflict_service
         self.test_results = []
         self.performance_metrics = {}
+        self._out: List[str] = []
+        self._db_ok = self._probe_db()
+
+    def _p(self, line: str = ""):
+        """Buffer an output line; run_all_tests writes the buffer in one go"""
+        self._out.append(line)
+
+    def _probe_db(self, timeout: float = 0.5) -> bool:
+        """Check once whether Neo4j answers a trivial query within the timeout"""
+
+        def _run_probe():
+            with neo4j_db.driver.session() as session:
+                return session.run("RETURN 1 as ok").single()["ok"] == 1
+
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            return pool.submit(_run_probe).result(timeout=timeout)
+        except Exception as e:
+            logger.warning(f"Neo4j unreachable, skipping database tests: {e}")
+            return False
+        finally:
+            # Don't block on a probe that is still waiting for the driver
+            pool.shutdown(wait=False)
+
+    def _skip_without_db(self, test_name: str) -> bool:
+        """Record test_name as skipped when the database probe failed"""
+        if self._db_ok:
+            return False
+        self.log_test(test_name, True, "Neo4j unreachable", skipped=True)
+        return True
 
     def log_test(
-        self, test_name: str, success: bool, details: str = "", duration: float = None
+        self,
+        test_name: str,
+        success: bool,
+        details: str = "",
+        duration_ns: int = None,
+        skipped: bool = False,
     ):
         """Log test results with performance metrics"""
-        status = "✅ PASS" if success else "❌ FAIL"
-        duration_str = f" ({duration:.3f}s)" if duration else ""
-        print(f"{status} {test_name}{duration_str}")
+        if skipped:
+            status = "⏭️  SKIP"
+        else:
+            status = "✅ PASS" if success else "❌ FAIL"
+        duration = duration_ns / 1e9 if duration_ns is not None else None
+        duration_str = f" ({duration:.3f}s)" if duration_ns else ""
+        self._p(f"{status} {test_name}{duration_str}")
         if details:
-            print(f"   Details: {details}")
+            self._p(f"   Details: {details}")
 
         self.test_results.append(
             {
@@ -41,220 +197,184 @@ class ProductionConflictResolutionTester:
                 "success": success,
                 "details": details,
                 "duration": duration,
+                "skipped": skipped,
             }
         )
 
-    def cleanup_test_data(self, item_ids: List[str]):
+    async def cleanup_test_data(self, item_ids: List[str]):
         """Clean up test data"""
-        for item_id in item_ids:
-            try:
-                self.graph_service.delete_item_completely(item_id)
-            except Exception as e:
-                print(f"Warning: Could not delete {item_id}: {e}")
+        try:
+            await asyncio.to_thread(self.graph_service.delete_items_bulk, item_ids)
+        except Exception as e:
+            self._p(f"Warning: Could not delete {item_ids}: {e}")
 
-    def test_1_basic_conflict_detection(self):
+    async def test_1_basic_conflict_detection(self):
         """Test basic conflict detection scenarios"""
-        print("\n🔍 Test 1: Basic Conflict Detection")
+        self._p("\n🔍 Test 1: Basic Conflict Detection")
+
+        if self._skip_without_db("Test 1: Basic Conflict Detection"):
+            return
 
         # Create test items
-        existing_items = []
-        try:
-            # Create items that should conflict
-            existing_items.append(
-                self.graph_service.create_item("Test Item 1", "album", 2020)
-            )
-            existing_items.append(
-                self.graph_service.create_item("Test Item 2", "song", 2021)
-            )
+        with self.graph_service.batch_session() as sess:
+            existing_items = []
+            try:
+                # Create items that should conflict
+                existing_items.append(
+                    await asyncio.to_thread(
+                        sess.create_item, "Test Item 1", "album", 2020
+                    )
+                )
+                existing_items.append(
+                    await asyncio.to_thread(
+                        sess.create_item, "Test Item 2", "song", 2021
+                    )
+                )
 
-            # Test exact name match
-            test_data = StructuredOutput(
-                main_item="Test Item 1",
-                main_item_type="album",
-                main_item_creator="Test Artist",
-                influences=[],
-                categories=[],
-            )
+                # Test exact name match
+                test_data = StructuredOutput(
+                    main_item="Test Item 1",
+                    main_item_type="album",
+                    main_item_creator="Test Artist",
+                    influences=[],
+                    categories=[],
+                )
 
-            start_time = time.time()
-            conflicts = self.conflict_service.find_comprehensive_conflicts(test_data)
-            duration = time.time() - start_time
+                t0 = time.perf_counter_ns()
+                conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_comprehensive_conflicts, test_data
+                )
+                duration_ns = time.perf_counter_ns() - t0
 
-            has_conflicts = len(conflicts["main_item_conflicts"]) > 0
-            self.log_test(
-                "Exact Name Conflict Detection",
-                has_conflicts,
-                f"Found {len(conflicts['main_item_conflicts'])} conflicts",
-                duration,
-            )
+                has_conflicts = len(conflicts["main_item_conflicts"]) > 0
+                self.log_test(
+                    "Exact Name Conflict Detection",
+                    has_conflicts,
+                    f"Found {len(conflicts['main_item_conflicts'])} conflicts",
+                    duration_ns,
+                )
 
-            # Test partial name match
-            test_data.main_item = "Test Item"
-            conflicts = self.conflict_service.find_comprehensive_conflicts(test_data)
+                # Test partial name match
+                test_data.main_item = "Test Item"
+                conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_comprehensive_conflicts, test_data
+                )
 
-            has_partial_conflicts = len(conflicts["main_item_conflicts"]) > 0
-            self.log_test(
-                "Partial Name Conflict Detection",
-                has_partial_conflicts,
-                f"Found {len(conflicts['main_item_conflicts'])} partial conflicts",
-            )
+                has_partial_conflicts = len(conflicts["main_item_conflicts"]) > 0
+                self.log_test(
+                    "Partial Name Conflict Detection",
+                    has_partial_conflicts,
+                    f"Found {len(conflicts['main_item_conflicts'])} partial conflicts",
+                )
 
-        finally:
-            self.cleanup_test_data([item.id for item in existing_items])
+            finally:
+                await self.cleanup_test_data([item.id for item in existing_items])
 
-    def test_2_comprehensive_merge_scenarios(self):
+    async def test_2_comprehensive_merge_scenarios(self):
         """Test all 4 merge scenarios comprehensively"""
-        print("\n🔍 Test 2: Comprehensive Merge Scenarios")
-
-        created_items = []
-        try:
-            # Scenario 1: Item-to-Item merge
-            main_item = self.graph_service.create_item("Main Item", "album", 2020)
-            created_items.append(main_item)
+        self._p("\n🔍 Test 2: Comprehensive Merge Scenarios")
 
-            test_data = StructuredOutput(
-                main_item="Main Item",
-                main_item_type="album",
-                main_item_creator="Artist",
-                influences=[
-                    StructuredInfluence(
-                        name="Influence 1",
-                        type="album",
-                        creator_name="Influence Artist",
-                        year=2019,
-                        category="Test",
-                        influence_type="inspiration",
-                        confidence=0.8,
-                        explanation="Test influence",
-                    )
-                ],
-                categories=["Test"],
-            )
+        if self._skip_without_db("Test 2: Comprehensive Merge Scenarios"):
+            return
 
-            conflicts = self.conflict_service.find_comprehensive_conflicts(test_data)
-            main_conflicts = len(conflicts["main_item_conflicts"])
-
-            self.log_test(
-                "Item-to-Item Merge Detection",
-                main_conflicts > 0,
-                f"Found {main_conflicts} main item conflicts",
-            )
-
-            # Scenario 2: Influence-to-Influence merge
-            influence_item = self.graph_service.create_item(
-                "Influence 1", "album", 2019
-            )
-            created_items.append(influence_item)
+        with self.graph_service.batch_session() as sess:
+            created_items = []
+            try:
+                # Scenario 1: Item-to-Item merge
+                main_item = await asyncio.to_thread(
+                    sess.create_item, "Main Item", "album", 2020
+                )
+                created_items.append(main_item)
 
-            conflicts = self.conflict_service.find_comprehensive_conflicts(test_data)
-            influence_conflicts = len(conflicts["influence_conflicts"])
+                test_data = StructuredOutput(
+                    main_item="Main Item",
+                    main_item_type="album",
+                    main_item_creator="Artist",
+                    influences=[
+                        StructuredInfluence(
+                            name="Influence 1",
+                            type="album",
+                            creator_name="Influence Artist",
+                            year=2019,
+                            category="Test",
+                            influence_type="inspiration",
+                            confidence=0.8,
+                            explanation="Test influence",
+                        )
+                    ],
+                    categories=["Test"],
+                )
 
-            self.log_test(
-                "Influence-to-Influence Merge Detection",
-                influence_conflicts > 0,
-                f"Found {influence_conflicts} influence conflicts",
-            )
+                main_item_conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_main_item_conflicts, test_data
+                )
+                main_conflicts = len(main_item_conflicts)
 
-            # Test resolution processing
-            if main_conflicts > 0 and influence_conflicts > 0:
-                # Simulate complete resolution
-                selected_main_item = main_item.id
-                influence_resolutions = {}
+                self.log_test(
+                    "Item-to-Item Merge Detection",
+                    main_conflicts > 0,
+                    f"Found {main_conflicts} main item conflicts",
+                )
 
-                for influence_key in conflicts["influence_conflicts"].keys():
-                    influence_resolutions[influence_key] = {
-                        "resolution": "merge",
-                        "selectedItemId": influence_item.id,
-                    }
+                # Scenario 2: Influence-to-Influence merge
+                influence_item = await asyncio.to_thread(
+                    sess.create_item, "Influence 1", "album", 2019
+                )
+                created_items.append(influence_item)
 
-                # Test that all conflicts are resolved
-                all_resolved = selected_main_item is not None and all(
-                    key in influence_resolutions
-                    for key in conflicts["influence_conflicts"].keys()
+                # Main item conflicts are unaffected by the new influence item, so
+                # only the influence side needs to be re-checked
+                influence_item_conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_influence_conflicts, test_data
                 )
+                influence_conflicts = len(influence_item_conflicts)
 
                 self.log_test(
-                    "Complete Resolution Validation",
-                    all_resolved,
-                    f"All {main_conflicts + influence_conflicts} conflicts resolved",
+                    "Influence-to-Influence Merge Detection",
+                    influence_conflicts > 0,
+                    f"Found {influence_conflicts} influence conflicts",
                 )
 
-        finally:
-            self.cleanup_test_data([item.id for item in created_items])
+                # Test resolution processing
+                if main_conflicts > 0 and influence_conflicts > 0:
+                    # Simulate complete resolution
+                    selected_main_item = main_item.id
+                    influence_resolutions = {}
+
+                    for influence_key in influence_item_conflicts.keys():
+                        influence_resolutions[influence_key] = {
+                            "resolution": "merge",
+                            "selectedItemId": influence_item.id,
+                        }
+
+                    # Test that all conflicts are resolved
+                    all_resolved = (
+                        selected_main_item is not None
+                        and influence_item_conflicts.keys()
+                        <= influence_resolutions.keys()
+                    )
+
+                    self.log_test(
+                        "Complete Resolution Validation",
+                        all_resolved,
+                        f"All {main_conflicts + influence_conflicts} conflicts resolved",
+                    )
+
+            finally:
+                await self.cleanup_test_data([item.id for item in created_items])
 
-    def test_3_edge_cases_and_error_conditions(self):
+    async def test_3_edge_cases_and_error_conditions(self):
         """Test edge cases and error conditions"""
-        print("\n🔍 Test 3: Edge Cases and Error Conditions")
+        self._p("\n🔍 Test 3: Edge Cases and Error Conditions")
 
-        # Test empty/null data
-        test_cases = [
-            (
-                "Empty main item",
-                StructuredOutput(
-                    main_item="",
-                    main_item_type="album",
-                    main_item_creator="",
-                    influences=[],
-                    categories=[],
-                ),
-            ),
-            (
-                "Null creator",
-                StructuredOutput(
-                    main_item="Test Item",
-                    main_item_type="album",
-                    main_item_creator=None,
-                    influences=[],
-                    categories=[],
-                ),
-            ),
-            (
-                "Empty influences",
-                StructuredOutput(
-                    main_item="Test Item",
-                    main_item_type="album",
-                    main_item_creator="Artist",
-                    influences=[],
-                    categories=[],
-                ),
-            ),
-            (
-                "Invalid influence names",
-                StructuredOutput(
-                    main_item="Test Item",
-                    main_item_type="album",
-                    main_item_creator="Artist",
-                    influences=[
-                        StructuredInfluence(
-                            name="",
-                            type="album",
-                            creator_name="Artist",
-                            year=2020,
-                            category="Test",
-                            influence_type="inspiration",
-                            confidence=0.8,
-                            explanation="Test",
-                        ),
-                        StructuredInfluence(
-                            name="None",
-                            type="album",
-                            creator_name="Artist",
-                            year=2020,
-                            category="Test",
-                            influence_type="inspiration",
-                            confidence=0.8,
-                            explanation="Test",
-                        ),
-                    ],
-                    categories=["Test"],
-                ),
-            ),
-        ]
+        if self._skip_without_db("Test 3: Edge Cases and Error Conditions"):
+            return
 
-        for test_name, test_data in test_cases:
+        # Test empty/null data
+        for test_name, test_data in _EDGE_CASE_FIXTURES:
             try:
-                conflicts = self.conflict_service.find_comprehensive_conflicts(
-                    test_data
+                conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_comprehensive_conflicts, test_data
                 )
                 self.log_test(
                     f"Edge Case: {test_name}",
@@ -266,22 +386,44 @@ class ProductionConflictResolutionTester:
                     f"Edge Case: {test_name}", False, f"Failed with error: {str(e)}"
                 )
 
-    def test_4_performance_and_scalability(self):
+    async def test_4_performance_and_scalability(self):
         """Test performance with larger datasets"""
-        print("\n🔍 Test 4: Performance and Scalability")
+        self._p("\n🔍 Test 4: Performance and Scalability")
+
+        if self._skip_without_db("Test 4: Performance and Scalability"):
+            return
 
         created_items = []
         try:
             # Create multiple items to test performance
-            start_time = time.time()
-
-            for i in range(10):
-                item = self.graph_service.create_item(
-                    f"Performance Test Item {i}", "album", 2020 + i
+            t0 = time.perf_counter_ns()
+
+            # Dispatch all creations at once; the Neo4j driver releases the GIL
+            # on network I/O so the worker threads overlap their round-trips
+            loop = asyncio.get_running_loop()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+                results = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            pool,
+                            self.graph_service.create_item,
+                            f"Performance Test Item {i}",
+                            "album",
+                            2020 + i,
+                        )
+                        for i in range(10)
+                    ),
+                    return_exceptions=True,
                 )
-                created_items.append(item)
 
-            creation_time = time.time() - start_time
+            # Track every successful creation before surfacing any failure so
+            # cleanup still removes the partial batch
+            created_items.extend(r for r in results if not isinstance(r, Exception))
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+            creation_ns = time.perf_counter_ns() - t0
 
             # Test conflict detection performance
             test_data = StructuredOutput(
@@ -303,198 +445,174 @@ class ProductionConflictResolutionTester:
                 categories=["Test"],
             )
 
-            start_time = time.time()
-            conflicts = self.conflict_service.find_comprehensive_conflicts(test_data)
-            detection_time = time.time() - start_time
+            t0 = time.perf_counter_ns()
+            conflicts = await asyncio.to_thread(
+                self.conflict_service.find_comprehensive_conflicts, test_data
+            )
+            detection_ns = time.perf_counter_ns() - t0
 
             self.log_test(
                 "Conflict Detection Performance",
-                detection_time < 1.0,  # Should complete in under 1 second
-                f"Detection took {detection_time:.3f}s for 10 items",
-                detection_time,
+                detection_ns < 1_000_000_000,  # Should complete in under 1 second
+                f"Detection took {detection_ns / 1e9:.3f}s for 10 items",
+                detection_ns,
             )
 
             self.log_test(
                 "Item Creation Performance",
-                creation_time < 5.0,  # Should create 10 items in under 5 seconds
-                f"Created 10 items in {creation_time:.3f}s",
-                creation_time,
+                creation_ns
+                < 5_000_000_000,  # Should create 10 items in under 5 seconds
+                f"Created 10 items in {creation_ns / 1e9:.3f}s",
+                creation_ns,
             )
 
         finally:
-            self.cleanup_test_data([item.id for item in created_items])
+            await self.cleanup_test_data([item.id for item in created_items])
 
-    def test_5_frontend_integration_simulation(self):
+    async def test_5_frontend_integration_simulation(self):
         """Simulate complete frontend integration workflow"""
-        print("\n🔍 Test 5: Frontend Integration Simulation")
-
-        created_items = []
-        try:
-            # Create existing items
-            main_item = self.graph_service.create_item(
-                "Existing Main Item", "album", 2020
-            )
-            influence_item = self.graph_service.create_item(
-                "Existing Influence", "album", 2019
-            )
-            created_items.extend([main_item, influence_item])
-
-            # Simulate user submitting proposals
-            test_data = StructuredOutput(
-                main_item="Existing Main Item",  # Will conflict
-                main_item_type="album",
-                main_item_creator="Artist",
-                influences=[
-                    StructuredInfluence(
-                        name="Existing Influence",  # Will conflict
-                        type="album",
-                        creator_name="Influence Artist",
-                        year=2019,
-                        category="Test",
-                        influence_type="inspiration",
-                        confidence=0.8,
-                        explanation="Test influence",
-                    ),
-                    StructuredInfluence(
-                        name="New Influence",  # No conflict
-                        type="album",
-                        creator_name="New Artist",
-                        year=2021,
-                        category="Test",
-                        influence_type="inspiration",
-                        confidence=0.7,
-                        explanation="New influence",
-                    ),
-                ],
-                categories=["Test"],
-            )
-
-            # Step 1: Conflict detection
-            conflicts = self.conflict_service.find_comprehensive_conflicts(test_data)
-
-            # Step 2: Simulate user selections
-            selected_main_item = main_item.id
-            influence_resolutions = {
-                "0": {  # First influence conflicts
-                    "resolution": "merge",
-                    "selectedItemId": influence_item.id,
-                }
-                # Second influence has no conflicts, so no resolution needed
-            }
-
-            # Step 3: Validate frontend logic
-            def areAllConflictsResolved():
-                # Check main item conflicts
-                if len(conflicts["main_item_conflicts"]) > 0 and not selected_main_item:
-                    return False
-
-                # Check influence conflicts
-                influence_conflict_keys = list(conflicts["influence_conflicts"].keys())
-                if len(influence_conflict_keys) > 0:
-                    return all(
-                        key in influence_resolutions for key in influence_conflict_keys
-                    )
-
-                return True
+        self._p("\n🔍 Test 5: Frontend Integration Simulation")
 
-            button_enabled = areAllConflictsResolved()
+        if self._skip_without_db("Test 5: Frontend Integration Simulation"):
+            return
 
-            # Debug information
-            main_conflicts_count = len(conflicts["main_item_conflicts"])
-            influence_conflicts_count = len(conflicts["influence_conflicts"])
-            influence_resolutions_count = len(influence_resolutions)
-            main_selected = selected_main_item is not None
-
-            print(
-                f"   Debug: Main conflicts: {main_conflicts_count}, Main selected: {main_selected}"
-            )
-            print(
-                f"   Debug: Influence conflicts: {influence_conflicts_count}, Resolutions: {influence_resolutions_count}"
-            )
-            print(
-                f"   Debug: Influence conflict keys: {list(conflicts['influence_conflicts'].keys())}"
-            )
-            print(f"   Debug: Resolution keys: {list(influence_resolutions.keys())}")
-
-            # The issue is that we have 3 main conflicts but only 1 is selected
-            # In the real frontend, user would need to select one of the 3 main conflicts
-            # For this test, let's simulate selecting the first main conflict
-            expected_button_enabled = (
-                main_selected
-                and influence_resolutions_count >= influence_conflicts_count
-            )
-
-            self.log_test(
-                "Frontend Integration Workflow",
-                expected_button_enabled,  # Use expected instead of actual button_enabled
-                f"Expected button enabled: {expected_button_enabled}, Main conflicts: {main_conflicts_count}, Influence conflicts: {influence_conflicts_count}, Resolutions: {influence_resolutions_count}",
-            )
-
-            # Step 4: Simulate resolution processing
-            if button_enabled:
-                # This would call the actual merge API
-                self.log_test(
-                    "Resolution Processing Ready",
-                    True,
-                    "All conflicts resolved, ready for backend processing",
+        with self.graph_service.batch_session() as sess:
+            created_items = []
+            try:
+                # Create existing items
+                main_item = await asyncio.to_thread(
+                    sess.create_item,
+                    "Existing Main Item",
+                    "album",
+                    2020,
                 )
+                influence_item = await asyncio.to_thread(
+                    sess.create_item,
+                    "Existing Influence",
+                    "album",
+                    2019,
+                )
+                created_items.extend([main_item, influence_item])
 
-        finally:
-            self.cleanup_test_data([item.id for item in created_items])
-
-    def test_6_error_recovery_and_validation(self):
-        """Test error recovery and validation scenarios"""
-        print("\n🔍 Test 6: Error Recovery and Validation")
-
-        # Test with invalid data (but valid Pydantic types)
-        invalid_test_cases = [
-            (
-                "Empty main item name",
-                StructuredOutput(
-                    main_item="",  # Empty string instead of None
-                    main_item_type="album",
-                    main_item_creator="Artist",
-                    influences=[],
-                    categories=[],
-                ),
-            ),
-            (
-                "Very long item name",
-                StructuredOutput(
-                    main_item="A" * 1000,  # Very long name
-                    main_item_type="album",
-                    main_item_creator="Artist",
-                    influences=[],
-                    categories=[],
-                ),
-            ),
-            (
-                "Empty influence name",
-                StructuredOutput(
-                    main_item="Test Item",
+                # Simulate user submitting proposals
+                test_data = StructuredOutput(
+                    main_item="Existing Main Item",  # Will conflict
                     main_item_type="album",
                     main_item_creator="Artist",
                     influences=[
                         StructuredInfluence(
-                            name="",  # Empty influence name
+                            name="Existing Influence",  # Will conflict
                             type="album",
-                            creator_name="Artist",
-                            year=2020,
+                            creator_name="Influence Artist",
+                            year=2019,
                             category="Test",
                             influence_type="inspiration",
-                            confidence=0.8,  # Valid confidence
-                            explanation="Test",
-                        )
+                            confidence=0.8,
+                            explanation="Test influence",
+                        ),
+                        StructuredInfluence(
+                            name="New Influence",  # No conflict
+                            type="album",
+                            creator_name="New Artist",
+                            year=2021,
+                            category="Test",
+                            influence_type="inspiration",
+                            confidence=0.7,
+                            explanation="New influence",
+                        ),
                     ],
                     categories=["Test"],
-                ),
-            ),
-        ]
+                )
+
+                # Step 1: Conflict detection
+                conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_comprehensive_conflicts, test_data
+                )
+
+                # Step 2: Simulate user selections
+                selected_main_item = main_item.id
+                influence_resolutions = {
+                    "0": {  # First influence conflicts
+                        "resolution": "merge",
+                        "selectedItemId": influence_item.id,
+                    }
+                    # Second influence has no conflicts, so no resolution needed
+                }
+
+                # Key views are computed once and reused below; they stay live and
+                # cost nothing to create
+                influence_conflict_keys = conflicts["influence_conflicts"].keys()
+                resolution_keys = influence_resolutions.keys()
+
+                # Step 3: Validate frontend logic
+                def areAllConflictsResolved():
+                    # Check main item conflicts
+                    if (
+                        len(conflicts["main_item_conflicts"]) > 0
+                        and not selected_main_item
+                    ):
+                        return False
+
+                    # Check influence conflicts (set-view subset check)
+                    return influence_conflict_keys <= resolution_keys
+
+                button_enabled = areAllConflictsResolved()
+
+                # Debug information
+                main_conflicts_count = len(conflicts["main_item_conflicts"])
+                influence_conflicts_count = len(conflicts["influence_conflicts"])
+                influence_resolutions_count = len(influence_resolutions)
+                main_selected = selected_main_item is not None
+
+                self._p(
+                    f"   Debug: Main conflicts: {main_conflicts_count}, Main selected: {main_selected}"
+                )
+                self._p(
+                    f"   Debug: Influence conflicts: {influence_conflicts_count}, Resolutions: {influence_resolutions_count}"
+                )
+                self._p(
+                    f"   Debug: Influence conflict keys: {list(influence_conflict_keys)}"
+                )
+                self._p(f"   Debug: Resolution keys: {list(resolution_keys)}")
+
+                # The issue is that we have 3 main conflicts but only 1 is selected
+                # In the real frontend, user would need to select one of the 3 main conflicts
+                # For this test, let's simulate selecting the first main conflict
+                expected_button_enabled = (
+                    main_selected
+                    and influence_resolutions_count >= influence_conflicts_count
+                )
+
+                self.log_test(
+                    "Frontend Integration Workflow",
+                    expected_button_enabled,  # Use expected instead of actual button_enabled
+                    f"Expected button enabled: {expected_button_enabled}, Main conflicts: {main_conflicts_count}, Influence conflicts: {influence_conflicts_count}, Resolutions: {influence_resolutions_count}",
+                )
+
+                # Step 4: Simulate resolution processing
+                if button_enabled:
+                    # This would call the actual merge API
+                    self.log_test(
+                        "Resolution Processing Ready",
+                        True,
+                        "All conflicts resolved, ready for backend processing",
+                    )
+
+            finally:
+                await self.cleanup_test_data([item.id for item in created_items])
+
+    async def test_6_error_recovery_and_validation(self):
+        """Test error recovery and validation scenarios"""
+        self._p("\n🔍 Test 6: Error Recovery and Validation")
+
+        if self._skip_without_db("Test 6: Error Recovery and Validation"):
+            return
 
-        for test_name, test_data in invalid_test_cases:
+        # Test with invalid data (but valid Pydantic types)
+        for test_name, test_data in _ERROR_RECOVERY_FIXTURES:
             try:
-                conflicts = self.conflict_service.find_comprehensive_conflicts(
-                    test_data
+                conflicts = await asyncio.to_thread(
+                    self.conflict_service.find_comprehensive_conflicts, test_data
                 )
                 self.log_test(
                     f"Error Recovery: {test_name}",
@@ -508,78 +626,122 @@ class ProductionConflictResolutionTester:
                     f"Failed with error: {str(e)}",
                 )
 
-    def run_all_tests(self):
-        """Run all production tests"""
-        print("🚀 Starting Production Conflict Resolution Tests")
-        print("=" * 70)
-
-        start_time = time.time()
-
-        try:
-            self.test_1_basic_conflict_detection()
-            self.test_2_comprehensive_merge_scenarios()
-            self.test_3_edge_cases_and_error_conditions()
-            self.test_4_performance_and_scalability()
-            self.test_5_frontend_integration_simulation()
-            self.test_6_error_recovery_and_validation()
+    async def run_all_tests(self):
+        """Run all production tests, overlapping the read-only ones"""
+        self._p("🚀 Starting Production Conflict Resolution Tests")
+        self._p("=" * 70)
+
+        t0 = time.perf_counter_ns()
+
+        # Tests that create items run one after another: find_similar_items
+        # matches on shared words, so items seeded by one test would show up
+        # as conflicts in another
+        mutating_tests = [
+            self.test_1_basic_conflict_detection,
+            self.test_2_comprehensive_merge_scenarios,
+            self.test_4_performance_and_scalability,
+            self.test_5_frontend_integration_simulation,
+        ]
+        read_only_tests = [
+            self.test_3_edge_cases_and_error_conditions,
+            self.test_6_error_recovery_and_validation,
+        ]
 
-        except Exception as e:
-            print(f"❌ Test execution failed: {e}")
-            import traceback
+        async def _serially(tests):
+            results = []
+            for test in tests:
+                try:
+                    results.append(await test())
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        serial_results, *read_only_results = await asyncio.gather(
+            _serially(mutating_tests),
+            *(test() for test in read_only_tests),
+            return_exceptions=True,
+        )
+        tests = mutating_tests + read_only_tests
+        results = serial_results + read_only_results
+        for test, result in zip(tests, results):
+            if isinstance(result, Exception):
+                self._p(f"❌ Test execution failed in {test.__name__}: {result}")
+                import traceback
 
-            traceback.print_exc()
+                self._p("".join(traceback.format_exception(result)).rstrip())
 
-        total_time = time.time() - start_time
+        total_time = (time.perf_counter_ns() - t0) / 1e9
 
         # Print comprehensive summary
-        print("\n" + "=" * 70)
-        print("📊 Production Test Summary")
-        print("=" * 70)
-
-        passed = sum(1 for result in self.test_results if result["success"])
+        self._p("\n" + "=" * 70)
+        self._p("📊 Production Test Summary")
+        self._p("=" * 70)
+
+        # Single pass over the results: tally outcomes and collect durations
+        passed = skipped = 0
+        failures = []
+        durations = array("d")
+        for result in self.test_results:
+            if result["skipped"]:
+                skipped += 1
+            elif result["success"]:
+                passed += 1
+            else:
+                failures.append(result)
+            if result["duration"] is not None:
+                durations.append(result["duration"])
         total = len(self.test_results)
+        ran = total - skipped
+        # Nothing to rate when every test was skipped
+        success_rate = f"{(passed / ran) * 100:.1f}%" if ran else "N/A"
 
-        print(f"Total Tests: {total}")
-        print(f"Passed: {passed}")
-        print(f"Failed: {total - passed}")
-        print(f"Total Execution Time: {total_time:.3f}s")
+        self._p(f"Total Tests: {total}")
+        self._p(f"Passed: {passed}")
+        self._p(f"Failed: {len(failures)}")
+        self._p(f"Skipped: {skipped}")
+        self._p(f"Total Execution Time: {total_time:.3f}s")
 
-        if total - passed > 0:
-            print("\n❌ Failed Tests:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"  - {result['test']}: {result['details']}")
+        if failures:
+            self._p("\n❌ Failed Tests:")
+            for result in failures:
+                self._p(f"  - {result['test']}: {result['details']}")
 
         # Performance metrics
-        durations = [
-            r.get("duration", 0)
-            for r in self.test_results
-            if r.get("duration") is not None
-        ]
-        avg_duration = sum(durations) / len(durations) if durations else 0
-        print(f"\n📈 Performance Metrics:")
-        print(f"  Average Test Duration: {avg_duration:.3f}s")
-        print(f"  Success Rate: {(passed/total)*100:.1f}%")
+        avg_duration = statistics.fmean(durations) if durations else 0.0
+        self._p(f"\n📈 Performance Metrics:")
+        self._p(f"  Average Test Duration: {avg_duration:.3f}s")
+        self._p(f"  Success Rate: {success_rate}")
 
-        print(f"\nSuccess Rate: {(passed/total)*100:.1f}%")
+        self._p(f"\nSuccess Rate: {success_rate}")
 
-        return passed == total
+        sys.stdout.write("\n".join(self._out) + "\n")
+        sys.stdout.flush()
+        self._out.clear()
+
+        # A run with skipped tests hasn't verified everything, so it never
+        # counts as a pass
+        return ran > 0 and not failures and not skipped
 
 
 def main():
     """Main test runner"""
     tester = ProductionConflictResolutionTester()
-    success = tester.run_all_tests()
+    success = asyncio.run(tester.run_all_tests())
 
     if success:
         print(
             "\n🎉 All production tests passed! Conflict resolution system is production-ready."
         )
-    else:
+    elif any(not r["success"] for r in tester.test_results):
         print("\n⚠️  Some tests failed. Review the details above before deploying.")
+    else:
+        print(
+            "\n⏭️  Some or all tests were skipped (is Neo4j running?). "
+            "Run the full suite before deploying."
+        )
 
     return success
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)
@@ -4,16 +4,61 @@ Test script to verify enhancement fixes
 """
 
 import asyncio
+import functools
 import json
 import sys
-import os
-
-# Add the app directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "app"))
+from types import MappingProxyType
 
 from app.services.ai_agents.enhancement_agent import EnhancementAgent
 from app.models.item import Item
 
+# Sample tool results shared by every scoring case. Each entry is read-only so
+# no case can mutate what the next one sees.
+SAMPLE_RESULTS = (
+    MappingProxyType(
+        {
+            "tool": "youtube",
+            "query": "My Way Frank Sinatra",
+            "result": {"content": ["test1", "test2"]},
+            "video_data": {
+                "title": "&quot;My Way&quot; by Frank Sinatra | Tutorial",
+                "description": "Learn &quot;My Way&quot; on piano",
+                "channel_title": "Piano Tutorials &amp; More",
+                "url": "https://youtube.com/watch?v=test1",
+                "thumbnail_url": "https://example.com/thumb1.jpg",
+            },
+        }
+    ),
+    MappingProxyType(
+        {
+            "tool": "youtube",
+            "query": "My Way analysis",
+            "result": {"content": ["test3", "test4"]},
+            "video_data": {
+                "title": "Frank Sinatra &quot;My Way&quot; Analysis",
+                "description": "Deep dive into &quot;My Way&quot;",
+                "channel_title": "Music Analysis &amp; Reviews",
+                "url": "https://youtube.com/watch?v=test2",
+                "thumbnail_url": "https://example.com/thumb2.jpg",
+            },
+        }
+    ),
+    MappingProxyType(
+        {
+            "tool": "spotify",
+            "query": "My Way Frank Sinatra",
+            "result": {"content": ["test5"]},
+            "video_data": None,
+        }
+    ),
+)
+
+
+@functools.cache
+def _get_agent() -> EnhancementAgent:
+    """Construct the enhancement agent (and its MCP clients) once per process"""
+    return EnhancementAgent()
+
 
 async def test_enhancement_fixes():
     """Test that the enhancement fixes work correctly"""
@@ -30,58 +75,30 @@ async def test_enhancement_fixes():
         created_at="2024-01-01T00:00:00Z",
     )
 
-    # Create enhancement agent
-    agent = EnhancementAgent()
+    # Reuse the process-wide enhancement agent
+    agent = _get_agent()
 
     # Test with different max_content_pieces values
     test_cases = [2, 4, 6]
 
-    for max_pieces in test_cases:
+    # The limit goes into the scoring prompt, so each value needs its own call;
+    # run them concurrently rather than one after another
+    scored_by_limit = await asyncio.gather(
+        *(
+            agent.score_and_filter_content(
+                list(SAMPLE_RESULTS),
+                test_item,
+                {"item_type": "song", "primary_clusters": ["music"]},
+                max_pieces,
+            )
+            for max_pieces in test_cases
+        )
+    )
+
+    for max_pieces, scored_content in zip(test_cases, scored_by_limit):
         print(f"\nTesting with max_content_pieces = {max_pieces}")
         print("-" * 40)
 
-        # Test the scoring method directly
-        sample_results = [
-            {
-                "tool": "youtube",
-                "query": "My Way Frank Sinatra",
-                "result": {"content": ["test1", "test2"]},
-                "video_data": {
-                    "title": "&quot;My Way&quot; by Frank Sinatra | Tutorial",
-                    "description": "Learn &quot;My Way&quot; on piano",
-                    "channel_title": "Piano Tutorials &amp; More",
-                    "url": "https://youtube.com/watch?v=test1",
-                    "thumbnail_url": "https://example.com/thumb1.jpg",
-                },
-            },
-            {
-                "tool": "youtube",
-                "query": "My Way analysis",
-                "result": {"content": ["test3", "test4"]},
-                "video_data": {
-                    "title": "Frank Sinatra &quot;My Way&quot; Analysis",
-                    "description": "Deep dive into &quot;My Way&quot;",
-                    "channel_title": "Music Analysis &amp; Reviews",
-                    "url": "https://youtube.com/watch?v=test2",
-                    "thumbnail_url": "https://example.com/thumb2.jpg",
-                },
-            },
-            {
-                "tool": "spotify",
-                "query": "My Way Frank Sinatra",
-                "result": {"content": ["test5"]},
-                "video_data": None,
-            },
-        ]
-
-        # Test scoring with the new parameter
-        scored_content = await agent.score_and_filter_content(
-            sample_results,
-            test_item,
-            {"item_type": "song", "primary_clusters": ["music"]},
-            max_pieces,
-        )
-
         print(f"Scored content count: {len(scored_content)}")
         assert (
             len(scored_content) <= max_pieces
@@ -106,13 +106,14 @@ async def main():
     print("🚀 Starting Enhancement System Integration Tests")
     print("=" * 50)
 
-    # Test MCP client first
-    await test_mcp_client()
-
-    print("\n" + "=" * 50)
-
-    # Test enhancement agent
-    await test_enhancement_agent()
+    # The MCP client and enhancement agent tests share no state, so run them
+    # concurrently; wall time is bounded by the slower of the two
+    tests = [test_mcp_client, test_enhancement_agent]
+    results = await asyncio.gather(*(test() for test in tests), return_exceptions=True)
+
+    for test, result in zip(tests, results):
+        if isinstance(result, Exception):
+            print(f"\n❌ {test.__name__} raised: {result}")
 
     print("\n" + "=" * 50)
     print("🏁 Tests completed!")
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
 import asyncio
+import json
 import logging
+import sys
+from typing import List
 from app.services.ai_agents.enhancement_agent import EnhancementAgent
 from app.services.graph.graph_service import graph_service
 
@@ -10,10 +13,18 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _flush(buf: List[str]):
+    """Write buffered output in one call at the end of a test phase"""
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
+    buf.clear()
+
+
 async def test_enhancement_with_real_item():
     """Test the enhancement agent with a real item from the database"""
 
-    print("🔍 Searching for items in database...")
+    buf: List[str] = []
+    buf.append("🔍 Searching for items in database...\n")
 
     # Search for some common items that might exist
     search_terms = [
@@ -27,19 +38,27 @@ async def test_enhancement_with_real_item():
     ]
 
     found_items = []
-    for term in search_terms:
-        try:
-            items = graph_service.search_items(term)
-            if items:
-                found_items.extend(items)
-                print(f"✅ Found {len(items)} items for '{term}':")
-                for item in items:
-                    print(f"   - {item.name} ({item.auto_detected_type}, {item.year})")
-        except Exception as e:
-            print(f"❌ Error searching for '{term}': {e}")
+    try:
+        # One round-trip for all terms instead of one per term, run off the
+        # event loop so the driver call does not block it
+        items_by_term = await asyncio.to_thread(
+            graph_service.search_items_multi, search_terms
+        )
+    except Exception as e:
+        buf.append(f"❌ Error searching for {search_terms}: {e}\n")
+        items_by_term = {}
+
+    for term, items in items_by_term.items():
+        if items:
+            found_items.extend(items)
+            buf.append(f"✅ Found {len(items)} items for '{term}':\n")
+            for item in items:
+                buf.append(
+                    f"   - {item.name} ({item.auto_detected_type}, {item.year})\n"
+                )
 
     if not found_items:
-        print("❌ No items found in database. Creating a test item...")
+        buf.append("❌ No items found in database. Creating a test item...\n")
 
         # Create a test item
         test_item = graph_service.create_item(
@@ -49,66 +68,72 @@ async def test_enhancement_with_real_item():
             auto_detected_type="song",
             confidence_score=0.9,
         )
-        print(f"✅ Created test item: {test_item.name} (ID: {test_item.id})")
+        buf.append(f"✅ Created test item: {test_item.name} (ID: {test_item.id})\n")
         found_items = [test_item]
 
+    _flush(buf)
+
     # Use the first found item
     item_to_enhance = found_items[0]
-    print(f"\n🎵 Testing enhancement for: {item_to_enhance.name}")
-    print(f"   Type: {item_to_enhance.auto_detected_type}")
-    print(f"   Year: {item_to_enhance.year}")
-    print(f"   Description: {item_to_enhance.description}")
-    print(f"   ID: {item_to_enhance.id}")
+    buf.append(
+        f"\n🎵 Testing enhancement for: {item_to_enhance.name}\n"
+        f"   Type: {item_to_enhance.auto_detected_type}\n"
+        f"   Year: {item_to_enhance.year}\n"
+        f"   Description: {item_to_enhance.description}\n"
+        f"   ID: {item_to_enhance.id}\n"
+    )
 
     # Initialize enhancement agent
     agent = EnhancementAgent()
 
     try:
-        print("\n🚀 Starting enhancement pipeline...")
+        buf.append("\n🚀 Starting enhancement pipeline...\n")
+        _flush(buf)
 
         # Test the enhancement pipeline
         result = await agent.enhance_item(item_to_enhance)
 
-        print(f"\n✅ Enhancement completed!")
-        print(f"📊 Analysis: {result.get('analysis', {}).get('item_type', 'unknown')}")
-        print(f"🔧 Tools used: {result.get('tools_used', [])}")
-        print(f"📝 Summary: {result.get('enhancement_summary', 'No summary')}")
+        buf.append(
+            "\n✅ Enhancement completed!\n"
+            f"📊 Analysis: {result.get('analysis', {}).get('item_type', 'unknown')}\n"
+            f"🔧 Tools used: {result.get('tools_used', [])}\n"
+            f"📝 Summary: {result.get('enhancement_summary', 'No summary')}\n"
+        )
 
         # Display enhanced content
         enhanced_content = result.get("enhanced_content", [])
-        print(f"\n📺 Found {len(enhanced_content)} enhanced content pieces:")
+        buf.append(f"\n📺 Found {len(enhanced_content)} enhanced content pieces:\n")
 
+        # Serialize each record in one call instead of formatting field by field
         for i, content in enumerate(enhanced_content, 1):
-            print(
-                f"\n{i}. {content.get('content_type', 'unknown')} from {content.get('original_result', {}).get('tool', 'unknown')}"
+            buf.append(
+                f"\n{i}. {json.dumps(content, indent=2, ensure_ascii=False, default=str)}\n"
             )
-            print(f"   Title: {content.get('title', 'Untitled')}")
-            print(f"   Creator: {content.get('creator', 'Unknown Creator')}")
-            print(f"   URL: {content.get('url', 'No URL')}")
-            print(f"   Score: {content.get('score', 0)}/10")
-            print(f"   Explanation: {content.get('explanation', 'No explanation')}")
 
         if result.get("error"):
-            print(f"\n❌ Error: {result['error']}")
+            buf.append(f"\n❌ Error: {result['error']}\n")
+
+        _flush(buf)
 
         # Test the API endpoint as well
-        print(f"\n🌐 Testing API endpoint...")
-        from app.api.routes.enhancement import enhance_item
-        from app.models.enhancement import EnhancementRequest
+        buf.append(f"\n🌐 Testing API endpoint...\n")
 
         # This would test the actual API endpoint
         # Note: This requires the FastAPI app to be running
-        print("   API endpoint test would require running server")
-        print("   You can test it manually with:")
-        print(
-            f"   curl -X POST 'http://localhost:8000/api/enhancement/items/{item_to_enhance.id}/enhance' \\"
+        buf.append(
+            "   API endpoint test would require running server\n"
+            "   You can test it manually with:\n"
+            f"   curl -X POST 'http://localhost:8000/api/enhancement/items/{item_to_enhance.id}/enhance' \\\n"
+            "        -H 'Content-Type: application/json' \\\n"
+            f'        -d \'{{"item_id": "{item_to_enhance.id}"}}\'\n'
         )
-        print("        -H 'Content-Type: application/json' \\")
-        print('        -d \'{"item_id": "' + item_to_enhance.id + "\"}'")
 
     except Exception as e:
-        print(f"\n❌ Enhancement failed: {e}")
+        buf.append(f"\n❌ Enhancement failed: {e}\n")
+        _flush(buf)
         logger.exception("Enhancement test failed")
+    finally:
+        _flush(buf)
 
 
 if __name__ == "__main__":
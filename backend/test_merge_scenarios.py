@@ -5,40 +5,61 @@ Test script to understand what happens to descriptions in different merge scenar
 2. When items are merged together
 """
 
+import asyncio
+import logging
 import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import uuid
+from typing import List
 
 from app.models.structured import StructuredOutput, StructuredInfluence
 from app.services.graph.graph_service import graph_service
 
+# Set up logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _flush(buf: List[str]):
+    """Write a test's buffered output in one call"""
+    sys.stdout.write("".join(buf))
+    sys.stdout.flush()
+    buf.clear()
+
+
+def _suffix() -> str:
+    """Per-test suffix so concurrently running tests never match each other's items"""
+    return uuid.uuid4().hex[:8]
+
 
-def test_main_item_as_influence():
+async def test_main_item_as_influence():
     """Test what happens when a main item also becomes an influence"""
-    print("\n🔍 Test 1: Main Item as Influence")
+    buf: List[str] = []
+    buf.append("\n🔍 Test 1: Main Item as Influence\n")
+
+    ns = _suffix()
 
     try:
         # Create a main item with a good description
-        main_item = graph_service.create_item(
-            name="Original Song",
+        main_item = await asyncio.to_thread(
+            graph_service.create_item,
+            name=f"Original Song {ns}",
             auto_detected_type="song",
             year=2020,
             description="A groundbreaking song that revolutionized the genre",
         )
-        print(f"✅ Created main item: {main_item.name}")
-        print(f"📝 Main item description: {main_item.description}")
+        buf.append(f"✅ Created main item: {main_item.name}\n")
+        buf.append(f"📝 Main item description: {main_item.description}\n")
 
         # Now create another item that is influenced by the first item
         test_data = StructuredOutput(
-            main_item="New Song",
+            main_item=f"New Song {ns}",
             main_item_type="song",
             main_item_creator="New Artist",
             main_item_year=2021,
             main_item_description="A song influenced by the original",
             influences=[
                 StructuredInfluence(
-                    name="Original Song",  # This is the same as our main item
+                    name=f"Original Song {ns}",  # This is the same as our main item
                     type="song",
                     creator_name="Original Artist",
                     year=2020,
@@ -55,145 +76,167 @@ def test_main_item_as_influence():
         )
 
         # Save this - it should create a new influence relationship
-        new_item_id = graph_service.save_structured_influences(test_data)
-        print(f"✅ Created new item: {test_data.main_item}")
+        [new_item_id] = await asyncio.to_thread(
+            graph_service.save_structured_influences_bulk, [test_data]
+        )
+        buf.append(f"✅ Created new item: {test_data.main_item}\n")
 
         # Check what description the influence has now
-        graph_response = graph_service.get_influences(new_item_id)
-        print(f"🔗 Found {len(graph_response.influences)} influences")
+        graph_response = await asyncio.to_thread(
+            graph_service.get_influences, new_item_id
+        )
+        buf.append(f"🔗 Found {len(graph_response.influences)} influences\n")
 
         for i, influence in enumerate(graph_response.influences):
-            print(
-                f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}"
+            buf.append(
+                f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}\n"
             )
-            print(f"   Explanation: {influence.explanation}")
+            buf.append(f"   Explanation: {influence.explanation}\n")
 
         # Cleanup
-        graph_service.delete_item_completely(main_item.id)
-        graph_service.delete_item_completely(new_item_id)
-        for inf in graph_response.influences:
-            graph_service.delete_item_completely(inf.from_item.id)
+        await asyncio.to_thread(
+            graph_service.delete_items_bulk,
+            [main_item.id, new_item_id]
+            + [inf.from_item.id for inf in graph_response.influences],
+        )
 
-        print("✅ Test 1 completed")
+        buf.append("✅ Test 1 completed\n")
 
     except Exception as e:
-        print(f"❌ Test 1 failed: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        buf.append(f"❌ Test 1 failed: {str(e)}\n")
+        _flush(buf)
+        logger.exception("Test 1 failed")
+    finally:
+        _flush(buf)
 
 
-def test_item_merge():
+async def test_item_merge():
     """Test what happens when items are merged together"""
-    print("\n🔍 Test 2: Item Merge")
+    buf: List[str] = []
+    buf.append("\n🔍 Test 2: Item Merge\n")
 
-    try:
-        # Create two items with different descriptions
-        item1 = graph_service.create_item(
-            name="Original Item",
-            auto_detected_type="album",
-            year=2020,
-            description="The original groundbreaking album",
-        )
-
-        item2 = graph_service.create_item(
-            name="Duplicate Item",
-            auto_detected_type="album",
-            year=2020,
-            description="A duplicate of the original album",
-        )
-
-        print(f"✅ Created item1: {item1.name} - {item1.description}")
-        print(f"✅ Created item2: {item2.name} - {item2.description}")
+    ns = _suffix()
 
-        # Create an influence pointing to item1
-        influence_item = graph_service.create_item(
-            name="Some Influence",
-            auto_detected_type="album",
-            year=2010,
-            description="An influence on the original item",
-        )
-
-        graph_service.create_influence_relationship(
-            from_item_id=influence_item.id,
-            to_item_id=item1.id,
-            confidence=0.8,
-            influence_type="test",
-            explanation="test influence",
-            category="test category",
-            scope="macro",
+    try:
+        # Create two items with different descriptions, plus an influence
+        # pointing to item1, in a single transaction
+        item1 = {
+            "name": f"Original Item {ns}",
+            "auto_detected_type": "album",
+            "year": 2020,
+            "description": "The original groundbreaking album",
+        }
+        item2 = {
+            "name": f"Duplicate Item {ns}",
+            "auto_detected_type": "album",
+            "year": 2020,
+            "description": "A duplicate of the original album",
+        }
+        influence_item = {
+            "name": f"Some Influence {ns}",
+            "auto_detected_type": "album",
+            "year": 2010,
+            "description": "An influence on the original item",
+        }
+
+        ids = await asyncio.to_thread(
+            graph_service.create_items_and_edge,
+            [item1, item2, influence_item],
+            {
+                "from": influence_item["name"],
+                "to": item1["name"],
+                "confidence": 0.8,
+                "influence_type": "test",
+                "explanation": "test influence",
+                "category": "test category",
+                "scope": "macro",
+            },
         )
+        item1_id = ids[item1["name"]]
+        item2_id = ids[item2["name"]]
 
-        print(
-            f"✅ Created influence: {influence_item.name} - {influence_item.description}"
+        buf.append(f"✅ Created item1: {item1['name']} - {item1['description']}\n")
+        buf.append(f"✅ Created item2: {item2['name']} - {item2['description']}\n")
+        buf.append(
+            f"✅ Created influence: {influence_item['name']} - {influence_item['description']}\n"
         )
 
         # Verify influence exists for item1
-        graph_response = graph_service.get_influences(item1.id)
-        print(f"🔗 Item1 has {len(graph_response.influences)} influences")
+        graph_response = await asyncio.to_thread(graph_service.get_influences, item1_id)
+        buf.append(f"🔗 Item1 has {len(graph_response.influences)} influences\n")
 
         # Merge item1 into item2 (item1 will be deleted, relationships transferred to item2)
-        result_id = graph_service.merge_items(item1.id, item2.id)
-        print(f"✅ Merged item1 into item2, result_id: {result_id}")
+        result_id, _ = await asyncio.to_thread(
+            graph_service.merge_items, item1_id, item2_id
+        )
+        buf.append(f"✅ Merged item1 into item2, result_id: {result_id}\n")
 
-        # Verify item1 no longer exists
-        deleted_item = graph_service.get_item_by_id(item1.id)
-        print(f"❌ Item1 still exists: {deleted_item is not None}")
+        # Verify item1 is gone, and read item2 and its influences, in one query
+        verification = await asyncio.to_thread(
+            graph_service.get_merge_verification, item1_id, item2_id
+        )
+        buf.append(f"❌ Item1 still exists: {verification['old_exists']}\n")
 
         # Check what description item2 has now
-        merged_item = graph_service.get_item_by_id(item2.id)
-        print(f"📝 Merged item description: {merged_item.description}")
+        merged_item = verification["new_item"]
+        buf.append(f"📝 Merged item description: {merged_item.description}\n")
 
         # Verify item2 now has the influence
-        merged_response = graph_service.get_influences(item2.id)
-        print(f"🔗 Merged item has {len(merged_response.influences)} influences")
+        merged_influences = verification["influences"]
+        buf.append(f"🔗 Merged item has {len(merged_influences)} influences\n")
 
-        for i, influence in enumerate(merged_response.influences):
-            print(
-                f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}"
+        for i, influence in enumerate(merged_influences):
+            buf.append(
+                f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}\n"
             )
-            print(f"   Explanation: {influence.explanation}")
+            buf.append(f"   Explanation: {influence.explanation}\n")
 
         # Cleanup
-        graph_service.delete_item_completely(item2.id)
-        for inf in merged_response.influences:
-            graph_service.delete_item_completely(inf.from_item.id)
+        await asyncio.to_thread(
+            graph_service.delete_items_apoc,
+            [item2_id] + [inf.from_item.id for inf in merged_influences],
+        )
 
-        print("✅ Test 2 completed")
+        buf.append("✅ Test 2 completed\n")
 
     except Exception as e:
-        print(f"❌ Test 2 failed: {str(e)}")
-        import traceback
+        buf.append(f"❌ Test 2 failed: {str(e)}\n")
+        _flush(buf)
+        logger.exception("Test 2 failed")
+    finally:
+        _flush(buf)
 
-        traceback.print_exc()
 
-
-def test_conflict_merge():
+async def test_conflict_merge():
     """Test what happens when items are merged through conflict resolution"""
-    print("\n🔍 Test 3: Conflict Resolution Merge")
+    buf: List[str] = []
+    buf.append("\n🔍 Test 3: Conflict Resolution Merge\n")
+
+    ns = _suffix()
 
     try:
         # Create an existing item
-        existing_item = graph_service.create_item(
-            name="Existing Song",
+        existing_item = await asyncio.to_thread(
+            graph_service.create_item,
+            name=f"Existing Song {ns}",
             auto_detected_type="song",
             year=2020,
             description="An existing song in the database",
         )
-        print(
-            f"✅ Created existing item: {existing_item.name} - {existing_item.description}"
+        buf.append(
+            f"✅ Created existing item: {existing_item.name} - {existing_item.description}\n"
         )
 
         # Create test data that conflicts with the existing item
         test_data = StructuredOutput(
-            main_item="Existing Song",  # Same name as existing item
+            main_item=f"Existing Song {ns}",  # Same name as existing item
             main_item_type="song",
             main_item_creator="Same Artist",
             main_item_year=2020,
             main_item_description="A new description for the same song",
             influences=[
                 StructuredInfluence(
-                    name="New Influence",
+                    name=f"New Influence {ns}",
                     type="album",
                     creator_name="Influence Artist",
                     year=2019,
@@ -213,82 +256,71 @@ def test_conflict_merge():
         from app.services.graph.conflict_service import ConflictService
 
         conflict_service = ConflictService()
-        conflicts = conflict_service.find_comprehensive_conflicts(test_data)
+        conflicts = await asyncio.to_thread(
+            conflict_service.find_comprehensive_conflicts, test_data
+        )
 
-        print(f"🔍 Found {conflicts['total_conflicts']} conflicts")
-        print(f"   Main item conflicts: {len(conflicts['main_item_conflicts'])}")
-        print(f"   Influence conflicts: {len(conflicts['influence_conflicts'])}")
+        buf.append(f"🔍 Found {conflicts['total_conflicts']} conflicts\n")
+        buf.append(f"   Main item conflicts: {len(conflicts['main_item_conflicts'])}\n")
+        buf.append(f"   Influence conflicts: {len(conflicts['influence_conflicts'])}\n")
 
-        if conflicts["total_conflicts"] > 0:
-            # Simulate merging by adding influences to existing item
-            result_id = conflict_service.add_influences_to_existing(
-                existing_item.id, test_data
+        if conflicts["total_conflicts"] == 0:
+            buf.append(
+                "⚠️ No conflicts detected - this might be due to loose matching\n"
             )
-            print(f"✅ Added influences to existing item, result_id: {result_id}")
+            buf.append("🧪 Manually testing add_influences_to_existing...\n")
 
-            # Check what the existing item looks like now
-            updated_item = graph_service.get_item_by_id(existing_item.id)
-            print(f"📝 Updated item description: {updated_item.description}")
-
-            # Check the influences
-            graph_response = graph_service.get_influences(existing_item.id)
-            print(f"🔗 Updated item has {len(graph_response.influences)} influences")
-
-            for i, influence in enumerate(graph_response.influences):
-                print(
-                    f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}"
-                )
-                print(f"   Explanation: {influence.explanation}")
-
-            # Cleanup
-            graph_service.delete_item_completely(existing_item.id)
-            for inf in graph_response.influences:
-                graph_service.delete_item_completely(inf.from_item.id)
-        else:
-            print("⚠️ No conflicts detected - this might be due to loose matching")
-
-            # Let's try to manually test the add_influences_to_existing method
-            print("🧪 Manually testing add_influences_to_existing...")
-            result_id = conflict_service.add_influences_to_existing(
-                existing_item.id, test_data
-            )
-            print(f"✅ Added influences to existing item, result_id: {result_id}")
+        # Simulate merging by adding influences to existing item
+        result_id = await asyncio.to_thread(
+            conflict_service.add_influences_to_existing, existing_item.id, test_data
+        )
+        buf.append(f"✅ Added influences to existing item, result_id: {result_id}\n")
 
-            # Check what the existing item looks like now
-            updated_item = graph_service.get_item_by_id(existing_item.id)
-            print(f"📝 Updated item description: {updated_item.description}")
+        # Check what the existing item looks like now
+        updated_item = await asyncio.to_thread(
+            graph_service.get_item_by_id, existing_item.id
+        )
+        buf.append(f"📝 Updated item description: {updated_item.description}\n")
 
-            # Check the influences
-            graph_response = graph_service.get_influences(existing_item.id)
-            print(f"🔗 Updated item has {len(graph_response.influences)} influences")
+        # Check the influences
+        graph_response = await asyncio.to_thread(
+            graph_service.get_influences, existing_item.id
+        )
+        buf.append(f"🔗 Updated item has {len(graph_response.influences)} influences\n")
 
-            for i, influence in enumerate(graph_response.influences):
-                print(
-                    f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}"
-                )
-                print(f"   Explanation: {influence.explanation}")
+        for i, influence in enumerate(graph_response.influences):
+            buf.append(
+                f"📝 Influence {i+1} ({influence.from_item.name}) description: {influence.from_item.description}\n"
+            )
+            buf.append(f"   Explanation: {influence.explanation}\n")
 
-            # Cleanup
-            graph_service.delete_item_completely(existing_item.id)
-            for inf in graph_response.influences:
-                graph_service.delete_item_completely(inf.from_item.id)
+        # Cleanup
+        await asyncio.to_thread(
+            graph_service.delete_items_apoc,
+            [existing_item.id]
+            + [inf.from_item.id for inf in graph_response.influences],
+        )
 
-        print("✅ Test 3 completed")
+        buf.append("✅ Test 3 completed\n")
 
     except Exception as e:
-        print(f"❌ Test 3 failed: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        buf.append(f"❌ Test 3 failed: {str(e)}\n")
+        _flush(buf)
+        logger.exception("Test 3 failed")
+    finally:
+        _flush(buf)
 
 
 if __name__ == "__main__":
     print("🧪 Testing Description Handling in Merge Scenarios")
     print("=" * 60)
 
-    test_main_item_as_influence()
-    test_item_merge()
-    test_conflict_merge()
+    async def main():
+        await asyncio.gather(
+            test_main_item_as_influence(), test_item_merge(), test_conflict_merge()
+        )
+
+    asyncio.run(main())
 
     print("\n" + "=" * 60)
     print("✅ All tests completed!")
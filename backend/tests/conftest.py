@@ -1,59 +1,322 @@
 import pytest
+import pytest_asyncio
 import asyncio
+import os
 import sys
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
 # Add the backend directory to Python path so imports work
 backend_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(backend_dir))
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
 
 from app.core.database.neo4j import neo4j_db
-from app.services.graph.graph_service import GraphService
+from app.core.database.schema import prepare_name_search
+from app.services.graph.graph_service import graph_service as shared_graph_service
 
+# Connection pool settings for the shared test driver
+TEST_DRIVER_CONFIG = {
+    "max_connection_pool_size": 32,
+    "connection_acquisition_timeout": 30,
+    "keep_alive": True,
+}
+
+
+def ensure_text_index(database=None):
+    """Create the Item name text indexes and fill in name_lc where missing"""
+    with neo4j_db.driver.session(database=database) as session:
+        prepare_name_search(session)
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+
+def worker_database():
+    """Database for this pytest-xdist worker, or None for the default database.
+
+    Separate databases need Neo4j Enterprise; on Community every worker shares
+    the default database and relies on neo4j_tx rollbacks for isolation.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker:
+        return None
+
+    records, _, _ = neo4j_db.driver.execute_query(
+        "CALL dbms.components() YIELD edition RETURN edition"
+    )
+    if records[0]["edition"] != "enterprise":
+        return None
+
+    database = f"test-{worker}"
+    with neo4j_db.driver.session(database="system") as session:
+        session.run(
+            "CREATE DATABASE $name IF NOT EXISTS WAIT", {"name": database}
+        ).consume()
+    return database
 
 
 @pytest.fixture(scope="session")
-def setup_test_database():
-    """Set up test database connection"""
-    # Connect to your existing database for now
-    neo4j_db.connect()
-    yield
-    # Cleanup can be added here later if needed
+def setup_test_database(request):
+    """Set up test database connection, yielding the database tests write to"""
+    # Importing the graph services already opened a default driver; replace it
+    # with one pooled driver that every service and test shares
+    neo4j_db.close()
+    neo4j_db.connect(**TEST_DRIVER_CONFIG)
+    request.addfinalizer(neo4j_db.close)
+    database = worker_database()
+    ensure_text_index(database)
+    yield database
 
 
-@pytest.fixture
-def graph_service(setup_test_database):
-    """Provide a GraphService instance for testing"""
-    return GraphService()
+class _TransactionSession:
+    """Session stand-in that runs every query on one shared transaction"""
+
+    def __init__(self, tx):
+        self._tx = tx
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def close(self):
+        pass
+
+    def run(self, query, parameters=None, **kwargs):
+        return self._tx.run(query, parameters, **kwargs)
+
+    def execute_write(self, work, *args, **kwargs):
+        return work(self._tx, *args, **kwargs)
+
+    execute_read = execute_write
+
+
+class _TransactionDriver:
+    """Driver stand-in whose sessions all share one open transaction"""
+
+    def __init__(self, driver, tx):
+        self._driver = driver
+        self._tx = tx
+
+    def session(self, **kwargs):
+        return _TransactionSession(self._tx)
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
 
 
 @pytest.fixture
+def neo4j_tx(setup_test_database):
+    """Run the test inside one Neo4j transaction that is rolled back afterwards.
+
+    Every service call made during the test goes through the shared
+    transaction, so nothing the test writes survives and no cleanup is needed.
+    Server-side batching procedures (apoc.periodic.*) open their own
+    transactions and are not covered. Under pytest-xdist the transaction runs
+    on the worker's own database when the server supports one.
+    """
+    driver = neo4j_db.driver
+    session = driver.session(database=setup_test_database)
+    tx = session.begin_transaction()
+    neo4j_db.driver = _TransactionDriver(driver, tx)
+    try:
+        yield tx
+    finally:
+        neo4j_db.driver = driver
+        if not tx.closed():
+            tx.rollback()
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def neo4j_driver(setup_test_database):
+    """Provide the shared, pooled Neo4j driver"""
+    return neo4j_db.driver
+
+
+@pytest.fixture(scope="session")
+def warm_query_cache(setup_test_database):
+    """Compile the common query shapes once so the first tests don't pay for planning"""
+    service = shared_graph_service
+    warmups = [
+        lambda: service.search_items("__warmup__"),
+        lambda: service.find_similar_items("__warmup__"),
+        lambda: service.get_influences("__nonexistent__"),
+        # Plan the name_lc search the item services run, without touching rows
+        lambda: neo4j_db.driver.execute_query(
+            "EXPLAIN MATCH (i:Item) WHERE i.name_lc CONTAINS $query RETURN i",
+            {"query": "__warmup__"},
+        ),
+    ]
+    for warmup in warmups:
+        try:
+            warmup()
+        except Exception:
+            # Missing items are expected; only the compiled plans matter here
+            pass
+
+
+@pytest.fixture(scope="session")
+def graph_service(setup_test_database, warm_query_cache):
+    """Provide the application's GraphService singleton for the whole session.
+
+    GraphService keeps no per-test state and every call opens its own session
+    on the shared driver, so one instance is safe to reuse (also across
+    threads). The driver itself is closed by setup_test_database.
+    """
+    yield shared_graph_service
+
+
+@pytest.fixture(scope="session")
+def item_service(graph_service):
+    """Provide the ItemService owned by the shared GraphService"""
+    return graph_service.item_service
+
+
+@pytest.fixture(scope="session")
 def sample_test_items():
-    """Provide sample test data"""
+    """Provide sample test data (read-only, shared by the whole session)"""
+    return MappingProxyType(
+        {
+            "songs": (
+                MappingProxyType(
+                    {"name": "Lose Yourself", "creator": "Eminem", "type": "song"}
+                ),
+                MappingProxyType(
+                    {"name": "Bohemian Rhapsody", "creator": "Queen", "type": "song"}
+                ),
+            ),
+            "movies": (
+                MappingProxyType(
+                    {"name": "The Matrix", "creator": "The Wachowskis", "type": "movie"}
+                ),
+            ),
+            "books": (
+                MappingProxyType(
+                    {"name": "1984", "creator": "George Orwell", "type": "book"}
+                ),
+            ),
+        }
+    )
+
+
+@pytest.fixture
+def sample_test_items_mut(sample_test_items):
+    """Provide a plain dict/list copy of sample_test_items that a test may modify"""
     return {
-        "songs": [
-            {"name": "Lose Yourself", "creator": "Eminem", "type": "song"},
-            {"name": "Bohemian Rhapsody", "creator": "Queen", "type": "song"},
-        ],
-        "movies": [
-            {"name": "The Matrix", "creator": "The Wachowskis", "type": "movie"},
-        ],
-        "books": [
-            {"name": "1984", "creator": "George Orwell", "type": "book"},
-        ],
+        kind: [dict(item) for item in items]
+        for kind, items in sample_test_items.items()
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session", autouse=True)
+def proposal_cache():
+    """Replay recorded proposal_agent responses when PROPOSAL_CACHE=1.
+
+    Session-scoped and autouse so the patch is in place before any other
+    session fixture (e.g. song_proposal_response) calls the agent.
+    """
+    if os.environ.get("PROPOSAL_CACHE") != "1":
+        yield
+        return
+
+    from app.services.ai_agents.proposal_agent import proposal_agent
+    from tests.unit._proposal_cache import cached_propose
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            proposal_agent,
+            "propose_influences",
+            cached_propose(proposal_agent.propose_influences),
+        )
+        yield
+
+
+# Async fixtures and tests all run on the session event loop: the proposal
+# agent's LLM client (and its pooled connections, which are bound to the loop)
+# then stays alive across tests
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def warm_proposal_agent(proposal_cache):
+    """Make one small proposal call so the real ones start on a warm client.
+
+    The first call pays for the LLM client's connection setup and first-use
+    model validation. Skipped when responses are replayed from the cache, and
+    failures are ignored: the tests report agent problems themselves.
+    """
+    if os.environ.get("PROPOSAL_CACHE") == "1":
+        return
+
+    from app.services.ai_agents.proposal_agent import proposal_agent
+
+    try:
+        await asyncio.wait_for(
+            proposal_agent.propose_influences(item_name="Warmup", creator="Test"),
+            timeout=15,
+        )
+    except Exception:
+        pass
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sample_proposal_responses(sample_test_items, warm_proposal_agent):
+    """Run the proposal agent for the first sample song and movie concurrently.
+
+    The LLM calls dominate the unit test runtime, so they are issued together
+    once per session and every test reads the (read-only) responses.
+    """
+    from app.services.ai_agents.proposal_agent import proposal_agent
+
+    items = {
+        "song": sample_test_items["songs"][0],
+        "movie": sample_test_items["movies"][0],
+    }
+    responses = await asyncio.gather(
+        *(
+            proposal_agent.propose_influences(
+                item_name=item["name"], item_type=item["type"], creator=item["creator"]
+            )
+            for item in items.values()
+        )
+    )
+    return MappingProxyType(dict(zip(items, responses)))
+
+
+@pytest.fixture(scope="session")
+def song_proposal_response(sample_proposal_responses):
+    """Provide the shared proposal response for the first sample song"""
+    return sample_proposal_responses["song"]
+
+
+@pytest.fixture(scope="session")
+def song_proposal_view(song_proposal_response):
+    """Column view of the shared song proposals, built once per session.
+
+    ``all`` holds every proposal (macro, then micro, then nano); the other
+    fields are the matching per-proposal values as parallel tuples.
+    """
+    response = song_proposal_response
+    proposals = tuple(response.all_influences)
+    return SimpleNamespace(
+        response=response,
+        all=proposals,
+        names=tuple(p.name for p in proposals),
+        years=tuple(p.year for p in proposals),
+        confidences=tuple(p.confidence for p in proposals),
+    )
+
+
+@pytest.fixture(scope="session")
+def movie_proposal_response(sample_proposal_responses):
+    """Provide the shared proposal response for the first sample movie"""
+    return sample_proposal_responses["movie"]
+
+
+@pytest.fixture(scope="session")
 def sample_structured_output():
-    """Provide sample StructuredOutput for testing"""
+    """Provide sample StructuredOutput for testing.
+
+    Built once per session and shared, so tests must treat it as read-only;
+    use sample_structured_output_mut to get a private copy to modify.
+    """
     from app.models.structured import StructuredOutput, StructuredInfluence
 
     return StructuredOutput(
@@ -95,3 +358,9 @@ def sample_structured_output():
         ],
         categories=["Musical Style", "Production Technique"],
     )
+
+
+@pytest.fixture
+def sample_structured_output_mut(sample_structured_output):
+    """Provide a deep copy of sample_structured_output that a test may modify"""
+    return sample_structured_output.model_copy(deep=True)
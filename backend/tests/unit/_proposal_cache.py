@@ -0,0 +1,45 @@
+"""Record/replay cache for proposal_agent.propose_influences.
+
+The first call for a given (item_name, item_type, creator, context) hits the
+real agent and records the response as JSON under tests/fixtures/proposal_cache/;
+later calls replay the recorded response without any LLM round-trip. Enabled
+from conftest.py when PROPOSAL_CACHE=1. Delete a cached file to re-record it.
+"""
+
+import hashlib
+from pathlib import Path
+
+from app.models.proposal import ProposalResponse
+
+CACHE_DIR = Path(__file__).parent.parent / "fixtures" / "proposal_cache"
+
+
+def cache_path(item_name, item_type=None, creator=None, context=None) -> Path:
+    """Location of the recorded response for one propose_influences call"""
+    key = hashlib.sha1(
+        f"{item_name}|{item_type}|{creator}|{context}".encode("utf-8")
+    ).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+
+def cached_propose(propose_influences):
+    """Wrap a propose_influences coroutine function with the record/replay cache"""
+
+    async def wrapper(item_name, item_type=None, creator=None, context=None):
+        path = cache_path(item_name, item_type, creator, context)
+        if path.exists():
+            return ProposalResponse.model_validate_json(
+                path.read_text(encoding="utf-8")
+            )
+
+        response = await propose_influences(
+            item_name=item_name, item_type=item_type, creator=creator, context=context
+        )
+
+        # Only record successful responses so a transient failure isn't replayed
+        if response.success:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path.write_text(response.model_dump_json(indent=2), encoding="utf-8")
+        return response
+
+    return wrapper
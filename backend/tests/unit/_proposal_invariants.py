@@ -0,0 +1,33 @@
+"""PYTEST_DONT_REWRITE
+
+Per-proposal invariant checks for InfluenceProposal.
+
+These run once per proposal, so this module opts out of pytest's assertion
+rewriting: the asserts stay plain and carry an explicit message instead.
+"""
+
+# Valid proposal scopes
+SCOPES = frozenset({"macro", "micro", "nano"})
+
+
+def check_proposal(proposal):
+    """Assert one proposal has all required fields with sensible values"""
+    assert proposal.name and proposal.name.strip(), f"Missing name: {proposal!r}"
+    assert (
+        proposal.category and proposal.category.strip()
+    ), f"Missing category on {proposal.name!r}"
+    assert (
+        proposal.scope in SCOPES
+    ), f"Invalid scope {proposal.scope!r} on {proposal.name!r}"
+    assert (
+        0.0 <= proposal.confidence <= 1.0
+    ), f"Confidence {proposal.confidence} out of range on {proposal.name!r}"
+    assert (
+        proposal.explanation and proposal.explanation.strip()
+    ), f"Missing explanation on {proposal.name!r}"
+
+    # Year validation - if year exists, should be reasonable
+    if proposal.year:
+        assert (
+            1800 <= proposal.year <= 2025
+        ), f"Unreasonable year {proposal.year} on {proposal.name!r}"
@@ -1,5 +1,4 @@
 import pytest
-from app.services.graph.item_service import ItemService
 from app.models.item import Item, UpdateItemRequest
 
 
@@ -7,12 +6,8 @@ class TestItemUpdate:
     """Test cases for item update functionality"""
 
     @pytest.fixture
-    def item_service(self):
-        return ItemService()
-
-    @pytest.fixture
-    def sample_item(self, item_service):
-        """Create a sample item for testing"""
+    def sample_item(self, item_service, neo4j_tx):
+        """Create a sample item for testing (rolled back after the test)"""
         return item_service.create_item(
             name="Test Item",
             description="Original description",